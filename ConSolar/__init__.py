@@ -7,6 +7,11 @@ from .plugin_manger import Plugin, PluginManager, EnhancedPlugin, plugin_manager
 from .logger import ConSolarLogger
 from .config_manager import ConfigManager, config_manager
 from .error_handler import ConSolarError, PluginError, safe_execute
+from .event_bus import EventBus, Event, event_bus
+from .shared_store import SharedStore, shared_store, attach
+from .cache_manager import CacheManager, cache_manager, memoize, cached_method
+from .scheduler import Scheduler, scheduler
+from .schema import Schema, compile_schema
 
 # Framework class (compatibility with README documentation)
 class Framework:
@@ -31,5 +36,8 @@ __all__ = [
     'user', 'Framework', 'Plugin', 'load_plugin', 'PluginManager', 
     'EnhancedPlugin', 'ConSolarLogger', 'ConfigManager', 'ConSolarError',
     'PluginError', 'safe_execute', 'plugin_manager', 'config_manager',
-    '__version__', '__framework__', 'parse', 'user.user_value'
+    '__version__', '__framework__', 'parse', 'user.user_value',
+    'EventBus', 'Event', 'event_bus', 'SharedStore', 'shared_store', 'attach',
+    'CacheManager', 'cache_manager', 'memoize', 'cached_method',
+    'Scheduler', 'scheduler', 'Schema', 'compile_schema'
 ]
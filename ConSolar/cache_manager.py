@@ -0,0 +1,300 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("CacheManager")
+
+_MISSING = object()
+_CANONICAL = object()  # Tags keys built from the canonical form of unhashable arguments
+
+# Argument types with a canonical form; anything else unhashable is not cached
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+_SEQUENCE_TYPES = (list, tuple)
+_SET_TYPES = (set, frozenset)
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready form of an argument that keeps types apart ([1] vs (1,), {1: x} vs {"1": x}).
+
+    Raises TypeError for values without a reliable canonical form (arbitrary objects).
+    """
+    kind = type(value)
+    if kind in _PLAIN_TYPES:
+        return [kind.__name__, value]
+    if kind is bytes:
+        return ["bytes", value.hex()]
+    if kind in _SEQUENCE_TYPES:
+        return [kind.__name__, [_canonical(item) for item in value]]
+    if kind in _SET_TYPES:
+        return [kind.__name__, sorted(json.dumps(_canonical(item)) for item in value)]
+    if kind is dict:
+        return ["dict", sorted(json.dumps([_canonical(k), _canonical(v)]) for k, v in value.items())]
+    raise TypeError(f"no canonical form for {kind.__name__}")
+
+class CacheStats:
+    """Hit/miss/eviction counters of a cache"""
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "disk_hits")
+
+    def __init__(self):
+        self.hits = self.misses = self.evictions = self.expirations = self.disk_hits = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+class PersistentTier:
+    """sqlite-backed storage shared by all persistent caches"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS memo ("
+            " namespace TEXT, cache TEXT, key TEXT, value BLOB, expires REAL,"
+            " PRIMARY KEY (namespace, cache, key))"
+        )
+
+    def get(self, namespace: str, cache: str, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM memo WHERE namespace=? AND cache=? AND key=?",
+                (namespace, cache, key)).fetchone()
+        if row is None:
+            return _MISSING, None
+        value, expires = row
+        if expires is not None and expires <= time.time():
+            self.delete(namespace, cache, key)
+            return _MISSING, None
+        return pickle.loads(value), expires
+
+    def set(self, namespace: str, cache: str, key: str, value: Any, expires: Optional[float]) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Value for {namespace}/{cache} is not picklable, memory only: {e}")
+            return
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?)",
+                               (namespace, cache, key, blob, expires))
+
+    def delete(self, namespace: str, cache: str, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM memo WHERE namespace=? AND cache=?", (namespace, cache))
+            else:
+                self._conn.execute("DELETE FROM memo WHERE namespace=? AND cache=? AND key=?",
+                                   (namespace, cache, key))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class MemoCache:
+    """Bounded in-memory LRU cache with optional TTL and an optional persistent tier"""
+
+    def __init__(self, name: str, namespace: str = "global", maxsize: int = 1024,
+                 ttl: Optional[float] = None, persistent: Optional[PersistentTier] = None):
+        self.name = name
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.persistent = persistent
+        self.stats = CacheStats()
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _disk_key(key: Hashable) -> Optional[str]:
+        """Stable key across processes, or None if the key only identifies objects of this process"""
+        if isinstance(key, tuple) and len(key) == 2 and key[0] is _CANONICAL:
+            canonical = key[1]
+        else:
+            try:
+                canonical = json.dumps(_canonical(key))
+            except (TypeError, ValueError):
+                return None  # e.g. object() arguments, whose repr holds a reusable address
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, checking memory first and then the persistent tier"""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._data[key]
+                self.stats.expirations += 1
+
+        disk_key = self._disk_key(key) if self.persistent is not None else None
+        if disk_key is not None:
+            value, expires_at = self.persistent.get(self.namespace, self.name, disk_key)
+            if value is not _MISSING:
+                with self._lock:
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    remaining = None if expires_at is None else expires_at - time.time()
+                    self._store(key, value, remaining)
+                return value
+
+        with self._lock:
+            self.stats.misses += 1
+        return default
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value (write-through to the persistent tier when enabled)"""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._store(key, value, ttl)
+        disk_key = self._disk_key(key) if self.persistent is not None else None
+        if disk_key is not None:
+            expires_at = None if ttl is None else time.time() + ttl
+            self.persistent.set(self.namespace, self.name, disk_key, value, expires_at)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+        disk_key = self._disk_key(key) if self.persistent is not None else None
+        if disk_key is not None:
+            self.persistent.delete(self.namespace, self.name, disk_key)
+
+    def clear(self, persistent: bool = False) -> None:
+        """Drop the in-memory entries, and the persisted ones if requested"""
+        with self._lock:
+            self._data.clear()
+        if persistent and self.persistent is not None:
+            self.persistent.delete(self.namespace, self.name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def _make_key(args: tuple, kwargs: dict) -> Optional[Hashable]:
+    """Cache key of a call, or None when its arguments cannot be keyed reliably"""
+    key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        pass
+    try:
+        # Unhashable arguments (lists, dicts) are keyed on their canonical JSON form
+        return (_CANONICAL, json.dumps(_canonical([list(args), kwargs])))
+    except (TypeError, ValueError):
+        return None
+
+class CacheManager:
+    """Registry of memoization caches grouped by namespace (one namespace per plugin)"""
+
+    def __init__(self, db_path: str = os.path.join("cache", "memo.sqlite3")):
+        self.db_path = db_path
+        self.caches: Dict[Tuple[str, str], MemoCache] = {}
+        self._persistent: Optional[PersistentTier] = None
+        self._lock = threading.Lock()
+
+    def _persistent_tier(self) -> PersistentTier:
+        if self._persistent is None:
+            self._persistent = PersistentTier(self.db_path)
+        return self._persistent
+
+    def get_cache(self, name: str, namespace: str = "global", maxsize: int = 1024,
+                  ttl: Optional[float] = None, persistent: bool = False) -> MemoCache:
+        """Get or create a named cache"""
+        cache = self.caches.get((namespace, name))
+        if cache is not None:
+            return cache
+        with self._lock:
+            cache = self.caches.get((namespace, name))
+            if cache is None:
+                cache = MemoCache(name, namespace, maxsize, ttl,
+                                  self._persistent_tier() if persistent else None)
+                self.caches[(namespace, name)] = cache
+            return cache
+
+    def memoize(self, namespace: str = "global", maxsize: int = 1024, ttl: Optional[float] = None,
+                persistent: bool = False, name: Optional[str] = None) -> Callable:
+        """Decorator caching a function's results by its arguments"""
+        def decorator(func: Callable) -> Callable:
+            cache = self.get_cache(name or f"{func.__module__}.{func.__qualname__}", namespace,
+                                   maxsize, ttl, persistent)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                if key is None:
+                    return func(*args, **kwargs)
+                value = cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)
+                    cache.set(key, value)
+                return value
+            wrapper.cache = cache
+            return wrapper
+        return decorator
+
+    def cached_method(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                      persistent: bool = False) -> Callable:
+        """Decorator for plugin methods; results go to the plugin's namespace and skip `self` in the key"""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(instance, *args, **kwargs):
+                namespace = getattr(instance, "name", instance.__class__.__name__)
+                cache = self.get_cache(func.__qualname__, namespace, maxsize, ttl, persistent)
+                key = _make_key(args, kwargs)
+                if key is None:
+                    return func(instance, *args, **kwargs)
+                value = cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = func(instance, *args, **kwargs)
+                    cache.set(key, value)
+                return value
+            return wrapper
+        return decorator
+
+    def clear_namespace(self, namespace: str, persistent: bool = False) -> int:
+        """Empty every cache of a namespace, e.g. when its plugin is unloaded"""
+        with self._lock:
+            caches = [cache for (ns, _), cache in self.caches.items() if ns == namespace]
+        for cache in caches:
+            cache.clear(persistent=persistent)
+        if caches:
+            logger.debug(f"Cleared {len(caches)} caches in namespace '{namespace}'")
+        return len(caches)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Statistics of every cache, keyed by 'namespace/name'"""
+        with self._lock:
+            caches = list(self.caches.values())
+        return {f"{c.namespace}/{c.name}": dict(c.stats.to_dict(), size=len(c)) for c in caches}
+
+# Global cache manager instance
+cache_manager = CacheManager()
+memoize = cache_manager.memoize
+cached_method = cache_manager.cached_method
@@ -0,0 +1,226 @@
+import asyncio
+import os
+import shlex
+import signal
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from error_handler import register_interrupt_callback, unregister_interrupt_callback
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("CommandRunner")
+
+Command = Union[str, Sequence[str]]
+LineCallback = Callable[["CommandResult", str, str], None]  # (result, stream name, line)
+
+class CommandResult:
+    """Outcome and timing of one command"""
+
+    def __init__(self, command: Command, tail_lines: int = 20):
+        self.command = command
+        self.label = command if isinstance(command, str) else shlex.join(command)
+        self.returncode: Optional[int] = None
+        self.started: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.timed_out = False
+        self.cancelled = False
+        self.error: Optional[str] = None  # Set when the command could not be started
+        self.stdout_lines = 0
+        self.stderr_lines = 0
+        self.tail = deque(maxlen=tail_lines)  # Last lines only, never the whole output
+        self.status = "queued"
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def __repr__(self) -> str:
+        return f"CommandResult({self.label!r}, returncode={self.returncode}, duration={self.duration})"
+
+class CommandRunner:
+    """Runs many commands concurrently with asyncio subprocesses, streaming their output"""
+
+    def __init__(self, max_concurrency: int = 4, timeout: Optional[float] = None,
+                 console: Optional[Console] = None):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.console = console or Console()
+        self.results: List[CommandResult] = []
+        self._processes: Dict[int, asyncio.subprocess.Process] = {}
+        self._cancelled = threading.Event()
+
+    def run(self, command: Command, timeout: Optional[float] = None, **options) -> CommandResult:
+        """Run a single command and return its result"""
+        return self.run_many([command], timeout=timeout, **options)[0]
+
+    def run_many(self, commands: List[Command], timeout: Optional[float] = None,
+                 on_line: Optional[LineCallback] = None, live: bool = False,
+                 cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> List[CommandResult]:
+        """Run commands with bounded concurrency; Ctrl+C cancels the batch instead of exiting"""
+        results = [CommandResult(command) for command in commands]
+        self._cancelled.clear()
+        register_interrupt_callback(self.cancel)
+        try:
+            if live:
+                # The table is rebuilt only when Live refreshes, not on every output line
+                with Live(get_renderable=lambda: self._live_table(results), console=self.console,
+                          refresh_per_second=4):
+                    asyncio.run(self._run_all(results, timeout, on_line, cwd, env, quiet=True))
+            else:
+                asyncio.run(self._run_all(results, timeout, on_line, cwd, env, quiet=False))
+        finally:
+            unregister_interrupt_callback(self.cancel)
+        self.results.extend(results)
+        return results
+
+    def cancel(self) -> bool:
+        """Kill every running command; used as the Ctrl+C handler while a batch runs"""
+        self._cancelled.set()
+        for process in list(self._processes.values()):
+            self._kill(process)
+        return True
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill a command and anything it spawned (shell pipelines keep the pipes open otherwise)"""
+        if process.returncode is not None:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    async def _run_all(self, results, timeout, on_line, cwd, env, quiet) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def guarded(result):
+            async with semaphore:
+                if self._cancelled.is_set():
+                    result.cancelled = True
+                    result.status = "cancelled"
+                    return
+                await self._run_one(result, timeout or self.timeout, on_line, cwd, env, quiet)
+
+        # return_exceptions keeps one failing command from abandoning the others mid-run
+        outcomes = await asyncio.gather(*(guarded(result) for result in results), return_exceptions=True)
+        for result, outcome in zip(results, outcomes):
+            if isinstance(outcome, BaseException):
+                result.error = result.error or str(outcome)
+                result.status = "error"
+                logger.error(f"Command '{result.label}' failed: {outcome}")
+
+    async def _run_one(self, result: CommandResult, timeout, on_line, cwd, env, quiet) -> None:
+        result.started = time.time()
+        start = time.perf_counter()
+        result.status = "running"
+        try:
+            if isinstance(result.command, str):
+                process = await asyncio.create_subprocess_shell(
+                    result.command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+                    env=env, start_new_session=os.name == "posix")
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *result.command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+                    env=env, start_new_session=os.name == "posix")
+        except (OSError, ValueError) as e:
+            result.error = str(e)
+            result.status = "error"
+            result.duration = time.perf_counter() - start
+            logger.warning(f"Command '{result.label}' could not be started: {e}")
+            return
+        self._processes[id(result)] = process
+
+        async def read_line(stream) -> bytes:
+            # readline() drops data and raises on lines over the stream limit; collect them in chunks
+            chunks = []
+            while True:
+                try:
+                    chunks.append(await stream.readuntil(b"\n"))
+                    break
+                except asyncio.IncompleteReadError as e:
+                    chunks.append(e.partial)  # Last line without a newline, or EOF
+                    break
+                except asyncio.LimitOverrunError as e:
+                    chunks.append(await stream.read(e.consumed))
+            return b"".join(chunks)
+
+        async def pump(stream, name):
+            while True:
+                raw = await read_line(stream)
+                if not raw:
+                    return
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                if name == "stdout":
+                    result.stdout_lines += 1
+                else:
+                    result.stderr_lines += 1
+                result.tail.append(line)
+                if on_line is not None:
+                    on_line(result, name, line)
+                elif not quiet:
+                    if name == "stdout":
+                        logger.info(f"[{result.label}] {line}")
+                    else:
+                        logger.warning(f"[{result.label}] {line}")
+
+        done = asyncio.gather(pump(process.stdout, "stdout"), pump(process.stderr, "stderr"), process.wait())
+        try:
+            await asyncio.wait_for(asyncio.shield(done), timeout)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+            self._kill(process)
+            await done
+        except BaseException:
+            # Cancelled or failed while running: never leave the child behind
+            self._kill(process)
+            await asyncio.gather(done, return_exceptions=True)
+            raise
+        finally:
+            self._processes.pop(id(result), None)
+
+        result.returncode = process.returncode
+        result.duration = time.perf_counter() - start
+        if self._cancelled.is_set() and not result.timed_out and result.returncode != 0:
+            result.cancelled = True
+        result.status = ("timeout" if result.timed_out else "cancelled" if result.cancelled
+                         else "ok" if result.returncode == 0 else f"exit {result.returncode}")
+        log = logger.info if result.ok else logger.warning
+        log(f"Command '{result.label}' finished: {result.status} in {result.duration:.2f}s")
+
+    @staticmethod
+    def _live_table(results: List[CommandResult]) -> Table:
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Command")
+        table.add_column("Status")
+        table.add_column("Time", justify="right")
+        table.add_column("Last output", overflow="ellipsis", no_wrap=True)
+        for result in results:
+            elapsed = result.duration if result.duration is not None else (
+                time.time() - result.started if result.started else 0)
+            table.add_row(result.label, result.status, f"{elapsed:.1f}s", result.tail[-1] if result.tail else "")
+        return table
+
+    def stats(self) -> Dict[str, float]:
+        """Timing and exit statistics over every command run so far"""
+        finished = [r for r in self.results if r.duration is not None]
+        durations = [r.duration for r in finished]
+        return {
+            "commands": len(self.results),
+            "succeeded": sum(1 for r in self.results if r.ok),
+            "failed": sum(1 for r in finished if not r.ok and not r.timed_out and not r.cancelled),
+            "timed_out": sum(1 for r in self.results if r.timed_out),
+            "cancelled": sum(1 for r in self.results if r.cancelled),
+            "total_time": sum(durations),
+            "mean_time": sum(durations) / len(durations) if durations else 0.0,
+            "max_time": max(durations, default=0.0),
+        }
+
+# Global command runner instance
+command_runner = CommandRunner()
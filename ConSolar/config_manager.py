@@ -1,9 +1,12 @@
+import copy
 import os
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from pathlib import Path
 from logger import ConSolarLogger
-from error_handler import ConfigurationError, safe_execute
+from error_handler import ConfigurationError, SchemaValidationError, safe_execute
+from event_bus import event_bus, CONFIG_CHANGED
+from schema import Schema
 
 logger = ConSolarLogger("ConfigManager")
 
@@ -16,6 +19,9 @@ class ConfigManager:
         self.config_path = os.path.join(config_dir, config_file)
         self.config_data: Dict[str, Any] = {}
         self.defaults: Dict[str, Any] = {}
+        self.schema: Optional[Schema] = None
+        self._config_valid = False  # Whether config_data has passed validation at least once
+        self.section_schemas: Dict[str, Schema] = {}
         
         # Ensure config directory exists
         os.makedirs(config_dir, exist_ok=True)
@@ -26,18 +32,56 @@ class ConfigManager:
         self.defaults = defaults
         logger.debug(f"Default configuration set with {len(defaults)} keys")
     
+    def set_schema(self, schema: Union[Schema, Dict[str, Any]]) -> None:
+        """Set the schema of the whole configuration tree"""
+        self.schema = schema if isinstance(schema, Schema) else Schema(schema, self.config_file)
+        logger.debug("Configuration schema set")
+
+    def register_section_schema(self, section: str, schema: Union[Schema, Dict[str, Any]]) -> None:
+        """Set the schema of one top-level section, e.g. a plugin's own config"""
+        self.section_schemas[section] = schema if isinstance(schema, Schema) else Schema(schema, section)
+        logger.debug(f"Schema registered for config section '{section}'")
+
+    def _validate_tree(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and coerce a whole config tree, raising every violation at once"""
+        errors: list = []
+        if self.schema is not None:
+            data = self.schema.apply(data, "", errors)
+        for section, schema in self.section_schemas.items():
+            if section in data:
+                data[section] = schema.apply(data[section], section, errors)
+        if errors:
+            raise SchemaValidationError(self.config_file, errors)
+        return data
+
+    def _validate_value(self, key_path: str, value: Any, separator: str = ".") -> Any:
+        """Validate and coerce a value about to be stored at key_path"""
+        errors: list = []
+        if self.schema is not None:
+            schema = self.schema.subschema(key_path, separator)
+            if schema is not None:
+                value = schema.apply(value, key_path, errors)
+        section, _, rest = key_path.partition(separator)
+        if section in self.section_schemas:
+            schema = self.section_schemas[section]
+            schema = schema.subschema(rest, separator) if rest else schema
+            if schema is not None:
+                value = schema.apply(value, key_path, errors)
+        if errors:
+            raise SchemaValidationError(key_path, errors)
+        return value
+
     @safe_execute(show_traceback=True)
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file"""
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self.config_data = json.load(f)
+                    loaded = json.load(f)
                 logger.info(f"Configuration loaded from {self.config_path}")
             else:
                 logger.warning(f"Config file not found: {self.config_path}, using defaults")
-                self.config_data = self.defaults.copy()
-                self.save_config()  # Create the file with defaults
+                loaded = copy.deepcopy(self.defaults)
                 
         except json.JSONDecodeError as e:
             raise ConfigurationError(self.config_file, f"Invalid JSON format: {str(e)}")
@@ -46,11 +90,27 @@ class ConfigManager:
         
         # Merge with defaults for missing keys
         for key, value in self.defaults.items():
-            if key not in self.config_data:
-                self.config_data[key] = value
+            if key not in loaded:
+                loaded[key] = copy.deepcopy(value)
         
+        self._apply_loaded(loaded)
+        if not os.path.exists(self.config_path):
+            self.save_config()  # Create the file with defaults
         return self.config_data
     
+    def _apply_loaded(self, loaded: Dict[str, Any]) -> None:
+        """Install a freshly loaded tree only if it validates, otherwise keep a valid config"""
+        try:
+            self.config_data = self._validate_tree(loaded)
+            self._config_valid = True
+        except SchemaValidationError:
+            if not self._config_valid:
+                # Nothing valid loaded yet: start from the defaults rather than the invalid file
+                self.config_data = self._validate_tree(copy.deepcopy(self.defaults))
+                self._config_valid = True
+            logger.warning(f"Invalid configuration in {self.config_path}, keeping the last valid configuration")
+            raise
+
     @safe_execute(show_traceback=True)
     def save_config(self) -> None:
         """Save current configuration to JSON file"""
@@ -69,9 +129,11 @@ class ConfigManager:
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value and save"""
+        value = self._validate_value(key, value)
         self.config_data[key] = value
         logger.debug(f"Config set '{key}': {value}")
         self.save_config()
+        event_bus.publish(CONFIG_CHANGED, {"key": key, "value": value})
     
     def get_nested(self, key_path: str, default: Any = None, separator: str = ".") -> Any:
         """Get nested configuration value using dot notation (e.g., 'database.host')"""
@@ -89,6 +151,7 @@ class ConfigManager:
     
     def set_nested(self, key_path: str, value: Any, separator: str = ".") -> None:
         """Set nested configuration value using dot notation"""
+        value = self._validate_value(key_path, value, separator)
         keys = key_path.split(separator)
         config = self.config_data
         
@@ -102,18 +165,23 @@ class ConfigManager:
         config[keys[-1]] = value
         logger.debug(f"Config set nested '{key_path}': {value}")
         self.save_config()
+        event_bus.publish(CONFIG_CHANGED, {"key": key_path, "value": value})
     
     def update(self, new_config: Dict[str, Any]) -> None:
         """Update configuration with new values"""
-        self.config_data.update(new_config)
+        candidate = dict(self.config_data)
+        candidate.update(new_config)
+        self.config_data = self._validate_tree(candidate)
         logger.info(f"Configuration updated with {len(new_config)} new values")
         self.save_config()
+        event_bus.publish(CONFIG_CHANGED, {"keys": list(new_config)})
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values"""
         self.config_data = self.defaults.copy()
         logger.info("Configuration reset to defaults")
         self.save_config()
+        event_bus.publish(CONFIG_CHANGED, {"keys": list(self.config_data)})
     
     def has_key(self, key: str) -> bool:
         """Check if configuration has a specific key"""
@@ -125,6 +193,7 @@ class ConfigManager:
             del self.config_data[key]
             logger.debug(f"Config key '{key}' removed")
             self.save_config()
+            event_bus.publish(CONFIG_CHANGED, {"key": key, "removed": True})
     
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration data"""
@@ -145,14 +214,19 @@ class ConfigManager:
             with open(import_path, 'r', encoding='utf-8') as f:
                 imported_config = json.load(f)
             
+            candidate = dict(self.config_data) if merge else {}
+            candidate.update(imported_config)
+            # Validate before touching the live config so a bad file changes nothing
+            self.config_data = self._validate_tree(candidate)
             if merge:
-                self.config_data.update(imported_config)
                 logger.info(f"Configuration merged from {import_path}")
             else:
-                self.config_data = imported_config
                 logger.info(f"Configuration replaced from {import_path}")
             
             self.save_config()
+            event_bus.publish(CONFIG_CHANGED, {"keys": list(imported_config), "source": import_path})
+        except SchemaValidationError:
+            raise
         except Exception as e:
             raise ConfigurationError(import_path, f"Failed to import config: {str(e)}")
 
@@ -210,12 +284,72 @@ default_config = {
     },
     "plugins": {
         "plugin_dir": "plugins",
-        "auto_load": True
+        "auto_load": True,
+        "accounting": {
+            "enabled": False,
+            "track_memory": False
+        }
     },
     "ui": {
         "theme": "default",
         "show_progress": True
+    },
+    "history": {
+        "max_entries": 100000
+    },
+    "http": {
+        "pool_connections": 10,
+        "pool_maxsize": 10,
+        "max_retries": 2,
+        "timeout": 10.0,
+        "max_workers": 8,
+        "cache_enabled": True,
+        "cache_dir": "cache/http",
+        "cache_ttl": 300
+    }
+}
+
+# Schema for the framework's own sections; unknown keys are left to plugins
+default_config_schema = {
+    "type": "dict",
+    "fields": {
+        "framework": {"type": "dict", "fields": {
+            "name": {"type": "str"},
+            "version": {"type": "str"},
+            "debug": {"type": "bool"}
+        }},
+        "logging": {"type": "dict", "fields": {
+            "level": {"type": "str", "choices": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]},
+            "log_dir": {"type": "str", "min_length": 1},
+            "log_file": {"type": "str", "min_length": 1}
+        }},
+        "plugins": {"type": "dict", "fields": {
+            "plugin_dir": {"type": "str", "min_length": 1},
+            "auto_load": {"type": "bool"},
+            "accounting": {"type": "dict", "fields": {
+                "enabled": {"type": "bool"},
+                "track_memory": {"type": "bool"}
+            }}
+        }},
+        "ui": {"type": "dict", "fields": {
+            "theme": {"type": "str"},
+            "show_progress": {"type": "bool"}
+        }},
+        "history": {"type": "dict", "fields": {
+            "max_entries": {"type": "int", "min": 1}
+        }},
+        "http": {"type": "dict", "fields": {
+            "pool_connections": {"type": "int", "min": 1},
+            "pool_maxsize": {"type": "int", "min": 1},
+            "max_retries": {"type": "int", "min": 0},
+            "timeout": {"type": "number", "min": 0},
+            "max_workers": {"type": "int", "min": 1},
+            "cache_enabled": {"type": "bool"},
+            "cache_dir": {"type": "str"},
+            "cache_ttl": {"type": "number", "min": 0}
+        }}
     }
 }
 
 config_manager.set_defaults(default_config)
+config_manager.set_schema(default_config_schema)
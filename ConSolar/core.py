@@ -83,6 +83,9 @@ from plugin_manger import (
 from config_manager import (
     ConfigManager, EnvConfig, config_manager
 )
+from event_bus import EventBus, Event, event_bus, USER_INPUT
+from history import HistoryStore, history_store, history_prompt
+from schema import Schema, compile_schema
 
 # for parser error handling
 import wrapt
@@ -97,13 +100,28 @@ class user:
         self.question = None
         self.user_value = None
 
-    def user_input(self, question) -> None:
+    def user_input(self, question, schema=None) -> None:
         self.question = question
-        self.user_value = input(self.question + " >>> ")
+        if schema is not None and not isinstance(schema, Schema):
+            schema = Schema(schema, question)
+        while True:
+            answer = history_prompt(self.question + " >>> ", prompt_id=self.question)
+            if schema is None:
+                break
+            errors = []
+            coerced = schema.apply(answer, question, errors)
+            if not errors:
+                answer = coerced
+                break
+            for error in errors:
+                print(f"  {error.message}")
+        self.user_value = answer
+        event_bus.publish(USER_INPUT, {"question": self.question, "value": self.user_value})
         # Now self.user_value holds the answer
         """
         code example:
         user_input(question)
+        user_input(question, schema={"type": "int", "min": 1})
         """
 
     def multi_choice(self, question, options) -> None:
@@ -114,6 +132,7 @@ class user:
         ]
         answers = prompt(questions)
         self.user_value = answers['choice'] if answers else None
+        event_bus.publish(USER_INPUT, {"question": self.question, "value": self.user_value})
         # Now self.user_value holds the answer
         """
         code example:
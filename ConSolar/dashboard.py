@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+ConSolar Framework - Textual Dashboard
+Virtualized views of the plugin registry and config tree plus a live log pane.
+"""
+
+import logging
+from typing import Any, Optional
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.containers import Vertical
+from textual.widgets import DataTable, Footer, Header, Input, RichLog, TabbedContent, TabPane, Tree
+from logger import ConSolarLogger, RingBufferHandler
+from plugin_manger import PluginManager, plugin_manager
+from config_manager import ConfigManager, config_manager
+
+logger = ConSolarLogger("Dashboard")
+
+LEVEL_STYLES = {
+    "DEBUG": "dim",
+    "INFO": "",
+    "WARNING": "yellow",
+    "ERROR": "bold red",
+    "CRITICAL": "bold white on red",
+}
+
+class ConSolarDashboard(App):
+    """Textual dashboard for plugins, configuration and live logs"""
+
+    TITLE = "ConSolar Dashboard"
+    CSS = """
+    TabbedContent { height: 2fr; }
+    #log-pane { height: 1fr; border-top: solid $accent; }
+    #plugin-filter { dock: top; }
+    """
+    BINDINGS = [
+        ("q", "quit", "Quit"),
+        ("r", "refresh", "Refresh"),
+        ("c", "clear_log", "Clear log"),
+    ]
+
+    def __init__(self, manager: Optional[PluginManager] = None, config: Optional[ConfigManager] = None,
+                 log_capacity: int = 5000, max_fps: float = 10.0):
+        super().__init__()
+        self.manager = manager or plugin_manager
+        self.config = config or config_manager
+        self.log_capacity = log_capacity
+        self.max_fps = max_fps
+        self.log_handler = RingBufferHandler(capacity=log_capacity)
+        self._log_sequence = 0
+        self._plugin_filter = ""
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Vertical():
+            with TabbedContent():
+                with TabPane("Plugins", id="plugins-tab"):
+                    yield Input(placeholder="Filter plugins...", id="plugin-filter")
+                    yield DataTable(id="plugin-table", cursor_type="row", zebra_stripes=True)
+                with TabPane("Config", id="config-tab"):
+                    yield Tree("config", id="config-tree")
+            yield RichLog(id="log-pane", max_lines=self.log_capacity, wrap=False, markup=False)
+        yield Footer()
+
+    def on_mount(self) -> None:
+        table = self.query_one("#plugin-table", DataTable)
+        table.add_columns("Name", "Version", "Module", "Enabled", "Dependencies")
+        self._populate_plugins()
+        self._populate_config()
+
+        # Log records are buffered by the handler and drained at a capped frame rate
+        logging.getLogger().addHandler(self.log_handler)
+        self.set_interval(1 / self.max_fps, self._drain_logs)
+
+    def on_unmount(self) -> None:
+        logging.getLogger().removeHandler(self.log_handler)
+
+    def _populate_plugins(self) -> None:
+        """Fill the plugin table; DataTable only renders the rows in view"""
+        table = self.query_one("#plugin-table", DataTable)
+        table.clear()
+        needle = self._plugin_filter.lower()
+        rows = []
+        for plugin in list(self.manager.plugins):
+            name = plugin.__class__.__name__
+            if needle and needle not in name.lower():
+                continue
+            rows.append((
+                name,
+                str(getattr(plugin, "version", "")),
+                plugin.__module__,
+                "yes" if getattr(plugin, "enabled", True) else "no",
+                ", ".join(getattr(plugin, "dependencies", [])),
+            ))
+        table.add_rows(rows)
+        self.sub_title = f"{len(rows)} of {len(self.manager.plugins)} plugins"
+
+    def _populate_config(self) -> None:
+        """Reset the config tree; children are created lazily when a node is expanded"""
+        tree = self.query_one("#config-tree", Tree)
+        tree.clear()
+        tree.root.data = self.config.get_all()
+        self._add_children(tree.root)
+        tree.root.expand()
+
+    @staticmethod
+    def _add_children(node) -> None:
+        value: Any = node.data
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        for key, child in items:
+            if isinstance(child, (dict, list)) and child:
+                node.add(str(key), data=child)
+            else:
+                node.add_leaf(f"{key} = {child!r}")
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        node = event.node
+        if node.data is not None and not node.children:
+            self._add_children(node)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "plugin-filter":
+            self._plugin_filter = event.value
+            self._populate_plugins()
+
+    def _drain_logs(self) -> None:
+        self._log_sequence, records = self.log_handler.since(self._log_sequence)
+        if not records:
+            return
+        log_pane = self.query_one("#log-pane", RichLog)
+        for record in records:
+            log_pane.write(Text(self.log_handler.format(record), style=LEVEL_STYLES.get(record.levelname, "")))
+
+    def action_refresh(self) -> None:
+        self._populate_plugins()
+        self._populate_config()
+
+    def action_clear_log(self) -> None:
+        self.query_one("#log-pane", RichLog).clear()
+
+def run_dashboard(manager: Optional[PluginManager] = None, config: Optional[ConfigManager] = None) -> None:
+    """Run the dashboard until the user quits"""
+    logger.info("Opening dashboard")
+    ConSolarDashboard(manager, config).run()
+
+def main() -> None:
+    """Standalone entry point: load config and plugins, then open the dashboard"""
+    config_manager.load_config()
+    if not plugin_manager.plugins:
+        plugin_manager.load_all_plugins()
+    run_dashboard()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import io
+import os
+import re
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional
+from rich.table import Table
+from error_handler import ConSolarError
+from logger import ConSolarLogger
+
+try:
+    import pandas as pd  # type: ignore
+except ImportError:
+    pd = None
+
+logger = ConSolarLogger("DataViewer")
+
+READ_BLOCK = 1024 * 1024
+# Whitespace-only lines after the first, which read_csv (skip_blank_lines) and read_json(lines=True)
+# ignore; anchoring on the newline is much faster than a MULTILINE "^"
+BLANK_LINE = re.compile(rb"\n[ \t\r\f\v]*(?=\n)")
+
+class TableSource:
+    """Chunked, bounded-memory access to a CSV or JSON Lines file.
+
+    Pages are located through a sparse index of byte offsets (one every
+    `index_every` records), so records must not contain embedded newlines.
+    """
+
+    def __init__(self, path: str, columns: Optional[List[str]] = None, dtype: Optional[Dict[str, Any]] = None,
+                 chunksize: int = 50000, file_format: Optional[str] = None, index_every: int = 1000):
+        if pd is None:
+            raise ConSolarError("pandas is required for the data viewer (pip install pandas)")
+        if not os.path.exists(path):
+            raise ConSolarError(f"Data file not found: {path}")
+        self.path = path
+        self.columns = columns
+        self.dtype = dtype
+        self.chunksize = chunksize
+        self.index_every = index_every
+        self.file_format = file_format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        self.header: Optional[List[str]] = None
+        self._offsets: Optional[List[int]] = None  # Byte offset of every index_every-th record
+        self._row_count: Optional[int] = None
+        self._data_start = 0
+
+    def iter_chunks(self) -> Iterator["pd.DataFrame"]:
+        """Stream the file as DataFrames of at most chunksize rows"""
+        if self.file_format == "csv":
+            reader = pd.read_csv(self.path, usecols=self.columns, dtype=self.dtype, chunksize=self.chunksize)
+        else:
+            reader = pd.read_json(self.path, lines=True, dtype=self.dtype, chunksize=self.chunksize)
+        with reader:
+            for chunk in reader:
+                yield chunk[self.columns] if self.columns and self.file_format != "csv" else chunk
+
+    def _build_index(self) -> None:
+        """Scan once for record boundaries, keeping only a sparse list of offsets"""
+        offsets = []
+        rows = 0
+        with open(self.path, "rb") as f:
+            if self.file_format == "csv":
+                header_line = self._next_record(f)
+                self.header = pd.read_csv(io.BytesIO(header_line), nrows=0).columns.tolist()
+            self._data_start = position = f.tell()
+            offsets.append(position)
+            carry = b""
+            while True:
+                block = f.read(READ_BLOCK)
+                if not block:
+                    break
+                # Only complete lines are counted; the tail is carried into the next block
+                cut = block.rfind(b"\n") + 1
+                if not cut:
+                    carry += block
+                    continue
+                lines, carry = carry + block[:cut], block[cut:]
+                newlines = lines.count(b"\n")
+                blanks = len(BLANK_LINE.findall(lines)) + (not lines[:lines.find(b"\n")].strip())
+                records = newlines - blanks
+                # Only locate individual lines when an index point falls among them
+                wanted = self.index_every - rows % self.index_every
+                if records >= wanted:
+                    parts = lines.split(b"\n")[:-1]
+                    ends = accumulate(map((1).__add__, map(len, parts)))  # Offset after each line
+                    if blanks:
+                        ends = [end for part, end in zip(parts, ends) if part.strip()]
+                    else:
+                        ends = list(ends)
+                    offsets.extend(position + end for end in ends[wanted - 1::self.index_every])
+                rows += records
+                position += len(lines)
+            if carry.strip():
+                rows += 1  # Final record without a trailing newline
+        self._offsets = offsets
+        self._row_count = rows
+        logger.debug(f"Indexed {rows} records in {self.path}")
+
+    @staticmethod
+    def _next_record(f) -> bytes:
+        """Read the next line that is not blank (b"" at the end of the file)"""
+        while True:
+            line = f.readline()
+            if not line or line.strip():
+                return line
+
+    @property
+    def row_count(self) -> int:
+        """Number of records (scans the file once on first use)"""
+        if self._row_count is None:
+            self._build_index()
+        return self._row_count
+
+    def page_count(self, page_size: int = 50) -> int:
+        return max(1, -(-self.row_count // page_size))
+
+    def read_rows(self, start: int, count: int) -> "pd.DataFrame":
+        """Read `count` records starting at record `start` without touching the rest of the file"""
+        if self._offsets is None:
+            self._build_index()
+        start = max(0, min(start, self._row_count))
+        count = max(0, min(count, self._row_count - start))
+        lines = []
+        if count:
+            with open(self.path, "rb") as f:
+                anchor = start // self.index_every
+                f.seek(self._offsets[anchor])
+                for _ in range(start - anchor * self.index_every):
+                    self._next_record(f)
+                for _ in range(count):
+                    lines.append(self._next_record(f))
+        return self._parse(b"".join(lines))
+
+    def page(self, number: int, page_size: int = 50) -> "pd.DataFrame":
+        """Get a zero-based page of records"""
+        return self.read_rows(number * page_size, page_size)
+
+    def _parse(self, raw: bytes) -> "pd.DataFrame":
+        if self.file_format == "csv":
+            if not raw.strip():
+                frame = pd.DataFrame(columns=self.header)
+            else:
+                frame = pd.read_csv(io.BytesIO(raw), header=None, names=self.header,
+                                    usecols=self.columns, dtype=self.dtype)
+            return frame[self.columns] if self.columns else frame
+        if not raw.strip():
+            return pd.DataFrame(columns=self.columns)
+        frame = pd.read_json(io.BytesIO(raw), lines=True, dtype=self.dtype)
+        return frame[self.columns] if self.columns else frame
+
+    def aggregate(self, value_counts: Optional[List[str]] = None, top: int = 10) -> Dict[str, Any]:
+        """Compute count, per-column min/max and value counts incrementally over all chunks"""
+        count = 0
+        minimum: Dict[str, Any] = {}
+        maximum: Dict[str, Any] = {}
+        unorderable = set()
+        counts: Dict[str, "pd.Series"] = {}
+        for chunk in self.iter_chunks():
+            count += len(chunk)
+            for column in chunk.columns:
+                if column in unorderable:
+                    continue
+                series = chunk[column].dropna()
+                if series.empty:
+                    continue
+                try:
+                    low, high = series.min(), series.max()
+                    if column in minimum:
+                        low, high = min(minimum[column], low), max(maximum[column], high)
+                except TypeError:
+                    # Mixed values, within a chunk or across chunks (e.g. numbers, then text):
+                    # a min/max of only part of the column would be misleading
+                    unorderable.add(column)
+                    minimum.pop(column, None)
+                    maximum.pop(column, None)
+                    continue
+                minimum[column], maximum[column] = low, high
+            for column in value_counts or []:
+                if column in chunk.columns:
+                    chunk_counts = chunk[column].value_counts()
+                    counts[column] = chunk_counts if column not in counts else counts[column].add(chunk_counts, fill_value=0)
+        return {
+            "count": count,
+            "min": minimum,
+            "max": maximum,
+            "value_counts": {
+                column: series.sort_values(ascending=False).head(top).astype(int).to_dict()
+                for column, series in counts.items()
+            },
+        }
+
+def render_table(frame: "pd.DataFrame", title: Optional[str] = None, first_row: int = 0) -> Table:
+    """Render a page as a Rich table"""
+    table = Table(title=title, show_lines=False)
+    table.add_column("#", justify="right", style="dim")
+    for column in frame.columns:
+        table.add_column(str(column))
+    for offset, row in enumerate(frame.itertuples(index=False), start=first_row):
+        table.add_row(str(offset), *("" if pd.isna(value) else str(value) for value in row))
+    return table
+
+def fill_data_table(data_table, frame: "pd.DataFrame", first_row: int = 0) -> None:
+    """Replace the contents of a Textual DataTable with a page"""
+    data_table.clear(columns=True)
+    data_table.add_columns("#", *(str(column) for column in frame.columns))
+    data_table.add_rows(
+        (str(offset), *("" if pd.isna(value) else str(value) for value in row))
+        for offset, row in enumerate(frame.itertuples(index=False), start=first_row)
+    )
+
+def browse(path: str, page_size: int = 25, **options) -> None:
+    """Page through a data file in the console"""
+    from rich.console import Console
+    console = Console()
+    source = TableSource(path, **options)
+    page = 0
+    while True:
+        console.print(render_table(source.page(page, page_size),
+                                   title=f"{path} - page {page + 1}/{source.page_count(page_size)}",
+                                   first_row=page * page_size))
+        command = input("[n]ext (Enter), [p]rev, [g]oto <page>, [q]uit >>> ").strip().lower()
+        if command in ("q", "quit"):
+            break
+        if command in ("n", ""):
+            if page == source.page_count(page_size) - 1:
+                break
+            page += 1
+        elif command == "p":
+            page = max(page - 1, 0)
+        elif command.startswith("g"):
+            try:
+                page = max(0, min(int(command[1:].strip()) - 1, source.page_count(page_size) - 1))
+            except ValueError:
+                console.print("[red]Usage: g <page>[/red]")
@@ -0,0 +1,406 @@
+import hashlib
+import json
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from error_handler import PluginError
+from logger import ConSolarLogger
+from snapshot import startup_snapshot
+
+logger = ConSolarLogger("DependencyResolver")
+
+_REQUIREMENT_RE = re.compile(r"^\s*([A-Za-z_][\w.\-]*)\s*(.*?)\s*$")
+_SPECIFIER_RE = re.compile(r"^\s*(==|!=|>=|<=|~=|>|<)\s*([\w.\-+*]+)\s*$")
+
+def _release(version: str) -> Tuple[int, ...]:
+    parts = []
+    for part in str(version).split("."):
+        digits = re.match(r"\d+", part)
+        if not digits:
+            break
+        parts.append(int(digits.group()))
+    return tuple(parts)
+
+def _prefix_match(version: str, prefix: str) -> bool:
+    current, wanted = _release(version), _release(prefix)
+    current += (0,) * (len(wanted) - len(current))
+    return current[:len(wanted)] == wanted
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a dotted version string into a comparable tuple ('2.1.0' -> (2, 1))"""
+    parts = list(_release(version))
+    # Drop trailing zeros so that 2.0 == 2.0.0
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts) or (0,)
+
+class Requirement:
+    """A plugin dependency with optional version constraints, e.g. 'UtilityPlugin>=2.0,<3'"""
+
+    def __init__(self, name: str, specifiers: List[Tuple[str, str]] = None):
+        self.name = name
+        self.specifiers = specifiers or []
+
+    @classmethod
+    def parse(cls, requirement: str) -> "Requirement":
+        """Parse a requirement string"""
+        match = _REQUIREMENT_RE.match(requirement)
+        if not match:
+            raise PluginError(requirement, "Invalid dependency specification")
+        name, spec = match.groups()
+        specifiers = []
+        for clause in filter(None, (c.strip() for c in spec.split(","))):
+            clause_match = _SPECIFIER_RE.match(clause)
+            if not clause_match:
+                raise PluginError(name, f"Invalid version constraint '{clause}'")
+            specifiers.append(clause_match.groups())
+        return cls(name, specifiers)
+
+    def matches(self, version: str) -> bool:
+        """Check whether a version satisfies every constraint"""
+        current = parse_version(version)
+        for op, wanted in self.specifiers:
+            if wanted.endswith(".*") and op in ("==", "!="):
+                ok = _prefix_match(version, wanted[:-2]) == (op == "==")
+            else:
+                target = parse_version(wanted)
+                if op == "==":
+                    ok = current == target
+                elif op == "!=":
+                    ok = current != target
+                elif op == ">=":
+                    ok = current >= target
+                elif op == "<=":
+                    ok = current <= target
+                elif op == ">":
+                    ok = current > target
+                elif op == "<":
+                    ok = current < target
+                else:  # ~= compatible release
+                    prefix = wanted.rsplit(".", 1)[0] if "." in wanted else wanted
+                    ok = current >= target and _prefix_match(version, prefix)
+            if not ok:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return self.name + ",".join(f"{op}{version}" for op, version in self.specifiers)
+
+class Resolution:
+    """Result of a dependency resolution"""
+
+    def __init__(self, selected: Dict[str, str], order: List[str], conflicts: List[str]):
+        self.selected = selected      # plugin name -> chosen version
+        self.order = order            # plugin names, dependencies first
+        self.conflicts = conflicts    # human readable reasons for excluded plugins
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"selected": self.selected, "order": self.order, "conflicts": self.conflicts}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "Resolution":
+        return cls(dict(data["selected"]), list(data["order"]), list(data["conflicts"]))
+
+# Manifest: plugin name -> {version: [requirement strings]}
+Manifest = Dict[str, Dict[str, List[str]]]
+
+class DependencyResolver:
+    """Backtracking resolver that picks one version per installed plugin"""
+
+    def __init__(self):
+        self._memo: Dict[str, Resolution] = {}
+
+    @staticmethod
+    def fingerprint(manifest: Manifest) -> str:
+        """Stable hash of a manifest, used to memoize solved graphs"""
+        return hashlib.sha256(json.dumps(manifest, sort_keys=True, default=repr).encode()).hexdigest()
+
+    def resolve(self, manifest: Manifest) -> Resolution:
+        """Resolve a manifest, reusing a memoized solution when the manifest is unchanged"""
+        fingerprint = self.fingerprint(manifest)
+        if fingerprint in self._memo:
+            return self._memo[fingerprint]
+        cached = startup_snapshot.load("dependencies", fingerprint)
+        if cached is not None:
+            resolution = Resolution.from_dict(cached)
+        else:
+            resolution = self._solve(manifest)
+            startup_snapshot.save("dependencies", fingerprint, resolution.to_dict())
+        self._memo[fingerprint] = resolution
+        return resolution
+
+    def _solve(self, manifest: Manifest) -> Resolution:
+        requirements = {}
+        conflicts: List[str] = []
+        causes: Dict[str, str] = {}  # excluded plugin -> root reason it was excluded
+
+        def exclude(name: str, reason: str, cause: Optional[str] = None) -> None:
+            conflicts.append(f"{name}: {reason}")
+            causes[name] = cause or f"{name}: {reason}"
+
+        for name, versions in manifest.items():
+            try:
+                requirements[name] = {version: [Requirement.parse(r) for r in deps] for version, deps in versions.items()}
+            except PluginError as e:
+                exclude(name, e.message)
+            except TypeError as e:
+                exclude(name, f"Invalid dependency specification ({e})")
+
+        # Unrelated plugins cannot constrain each other, so each connected group is
+        # solved on its own and a conflict only excludes the group it occurs in
+        selected: Dict[str, str] = {}
+        pending = deque(self._groups(requirements, set(requirements)))
+        while pending:
+            group = pending.popleft()
+            result = self._backtrack(requirements, group)
+            if result is not None:
+                selected.update(result)
+                continue
+            # Drop plugins that cannot be satisfied by any remaining candidate, then retry what is left
+            active = set(group)
+            neighbours = self._neighbours(requirements, active)
+            unchecked = deque(group)
+            while unchecked:
+                name = unchecked.popleft()
+                if name not in active:
+                    continue
+                reasons, cause = self._unsatisfiable(requirements, active, name, causes)
+                if reasons:
+                    exclude(name, "; ".join(reasons), cause)
+                    active.discard(name)
+                    unchecked.extend(neighbours[name] & active)  # They may have relied on it
+            if len(active) < len(group):
+                pending.extend(self._groups(requirements, active))
+                continue
+            # No single plugin is to blame: the versions in this group cannot be combined
+            members = ", ".join(group)
+            for name in group:
+                exclude(name, f"conflicting version constraints between {members}")
+
+        # Plugins in a dependency cycle can never be registered in order; exclude them and their dependents
+        excluded = self._cyclic(requirements, selected)
+        for name in sorted(excluded):
+            exclude(name, f"circular dependency between {', '.join(sorted(excluded[name]))}")
+        changed = bool(excluded)
+        while changed:
+            changed = False
+            for name in sorted(selected):
+                if name in excluded:
+                    continue
+                blocked = [req.name for req in requirements[name][selected[name]] if req.name in excluded]
+                if blocked:
+                    excluded[name] = set(blocked)
+                    cause = causes[blocked[0]]
+                    exclude(name, f"requires {', '.join(blocked)} which was excluded ({cause})", cause)
+                    changed = True
+        selected = {name: version for name, version in selected.items() if name not in excluded}
+
+        return Resolution(selected, self._order(requirements, selected), conflicts)
+
+    @staticmethod
+    def _neighbours(requirements, active) -> Dict[str, set]:
+        """Active plugins linked to each plugin by a requirement of any version, in either direction"""
+        neighbours = {name: set() for name in active}
+        for name in active:
+            for reqs in requirements[name].values():
+                for req in reqs:
+                    if req.name in active and req.name != name:
+                        neighbours[name].add(req.name)
+                        neighbours[req.name].add(name)
+        return neighbours
+
+    @classmethod
+    def _groups(cls, requirements, active) -> List[List[str]]:
+        """Split active plugins into groups connected by dependencies, each in breadth-first order"""
+        neighbours = cls._neighbours(requirements, active)
+        groups, seen = [], set()
+        for name in sorted(active):
+            if name in seen:
+                continue
+            # Breadth-first keeps related plugins next to each other for the search
+            group, queue = [], deque([name])
+            seen.add(name)
+            while queue:
+                current = queue.popleft()
+                group.append(current)
+                for other in sorted(neighbours[current] - seen):
+                    seen.add(other)
+                    queue.append(other)
+            groups.append(group)
+        return groups
+
+    @staticmethod
+    def _cyclic(requirements, selected: Dict[str, str]) -> Dict[str, set]:
+        """Map each plugin on a dependency cycle to the members of its cycle (Tarjan's SCC)"""
+        deps = {name: [req.name for req in requirements[name][version] if req.name in selected]
+                for name, version in selected.items()}
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
+        cyclic: Dict[str, set] = {}
+
+        def enter(name: str) -> None:
+            index[name] = low[name] = len(index)
+            stack.append(name)
+            on_stack.add(name)
+
+        for root in sorted(selected):
+            if root in index:
+                continue
+            enter(root)
+            work = [(root, iter(deps[root]))]
+            while work:
+                name, remaining = work[-1]
+                for dep in remaining:
+                    if dep not in index:
+                        enter(dep)
+                        work.append((dep, iter(deps[dep])))
+                        break
+                    if dep in on_stack:
+                        low[name] = min(low[name], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[name])
+                    if low[name] == index[name]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == name:
+                                break
+                        if len(component) > 1 or name in deps[name]:
+                            for member in component:
+                                cyclic[member] = component
+        return cyclic
+
+    def _backtrack(self, requirements, names: List[str]) -> Optional[Dict[str, str]]:
+        """Pick one version per plugin, newest first, or return None if no combination works.
+
+        The search keeps an explicit stack so deep dependency chains do not hit the
+        recursion limit, and every pick narrows the candidates of the plugins it is
+        linked to (forward checking), so dead ends are found before going deeper.
+        """
+        if not names:
+            return {}
+        members = set(names)
+        dependents: Dict[str, set] = {name: set() for name in names}
+        for name in names:
+            for reqs in requirements[name].values():
+                for req in reqs:
+                    if req.name in members and req.name != name:
+                        dependents[req.name].add(name)
+        candidates = {
+            name: [version for version in sorted(requirements[name], key=parse_version, reverse=True)
+                   if self._viable(requirements, members, name, version)]
+            for name in names
+        }
+        selected: Dict[str, str] = {}
+        # One frame per plugin being decided: (name, untried versions, candidate lists it narrowed)
+        frames = [(names[0], iter(candidates[names[0]]), [])]
+        while frames:
+            name, versions, undo = frames[-1]
+            self._restore(candidates, undo)
+            selected.pop(name, None)
+            for version in versions:
+                if self._assign(requirements, dependents, candidates, selected, undo, name, version):
+                    break
+                self._restore(candidates, undo)
+                del selected[name]
+            else:
+                frames.pop()
+                continue
+            if len(selected) == len(names):
+                return dict(selected)
+            following = names[len(frames)]
+            frames.append((following, iter(candidates[following]), []))
+        return None
+
+    @staticmethod
+    def _viable(requirements, members, name, version) -> bool:
+        """The candidate's own dependencies must exist and have at least one acceptable version"""
+        for req in requirements[name][version]:
+            if req.name not in members:
+                return False
+            if not any(req.matches(v) for v in requirements[req.name]):
+                return False
+        return True
+
+    @staticmethod
+    def _assign(requirements, dependents, candidates, selected, undo, name, version) -> bool:
+        """Select a version and narrow the candidates of undecided neighbours; False on a dead end"""
+        selected[name] = version
+        narrowed = {}
+        for req in requirements[name][version]:
+            if req.name not in selected:
+                current = narrowed.get(req.name, candidates[req.name])
+                narrowed[req.name] = [v for v in current if req.matches(v)]
+        for other in dependents[name]:
+            if other not in selected:
+                current = narrowed.get(other, candidates[other])
+                narrowed[other] = [v for v in current
+                                   if all(req.matches(version) for req in requirements[other][v] if req.name == name)]
+        for other, remaining in narrowed.items():
+            undo.append((other, candidates[other]))
+            candidates[other] = remaining
+        return all(narrowed.values())
+
+    @staticmethod
+    def _restore(candidates, undo) -> None:
+        while undo:
+            name, previous = undo.pop()
+            candidates[name] = previous
+
+    @staticmethod
+    def _unsatisfiable(requirements, active, name, causes) -> Tuple[List[str], Optional[str]]:
+        """Reasons why no version of a plugin can be satisfied, and the exclusion it inherits, if any"""
+        reasons = []
+        inherited = None
+        for version, reqs in requirements[name].items():
+            version_reasons = []
+            for req in reqs:
+                if req.name in causes:
+                    inherited = inherited or causes[req.name]
+                    version_reasons.append(f"requires {req} which was excluded ({causes[req.name]})")
+                elif req.name not in active:
+                    version_reasons.append(f"requires {req} which is not installed")
+                elif not any(req.matches(v) for v in requirements[req.name]):
+                    installed = ", ".join(sorted(requirements[req.name], key=parse_version))
+                    version_reasons.append(f"requires {req} but installed: {installed}")
+            if not version_reasons:
+                return [], None
+            reasons.append(f"v{version} " + ", ".join(version_reasons))
+        return reasons, inherited
+
+    @staticmethod
+    def _order(requirements, selected: Dict[str, str]) -> List[str]:
+        order: List[str] = []
+        placed = set()
+        visiting = set()
+        for root in sorted(selected):
+            if root in placed:
+                continue
+            visiting.add(root)
+            work = [(root, iter(requirements[root][selected[root]]))]
+            while work:
+                name, reqs = work[-1]
+                for req in reqs:
+                    if req.name in placed:
+                        continue
+                    if req.name in visiting:
+                        raise PluginError(req.name, "Circular plugin dependency")
+                    visiting.add(req.name)
+                    work.append((req.name, iter(requirements[req.name][selected[req.name]])))
+                    break
+                else:
+                    work.pop()
+                    visiting.discard(name)
+                    placed.add(name)
+                    order.append(name)
+        return order
+
+# Global resolver instance
+dependency_resolver = DependencyResolver()
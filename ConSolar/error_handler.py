@@ -37,11 +37,47 @@ class ValidationError(ConSolarError):
     def __init__(self, field: str, value: Any, message: str):
         self.field = field
         self.value = value
+        self.reason = message
         super().__init__(f"Validation error for '{field}' ({value}): {message}", exit_code=4)
 
+class CronExpressionError(ConSolarError, ValueError):
+    """Exception for malformed cron expressions; also a ValueError like other parse errors"""
+    def __init__(self, expression: str, message: str):
+        self.expression = expression
+        super().__init__(f"Cron expression '{expression}': {message}")
+
+class SchemaValidationError(ValidationError):
+    """Batch of validation errors collected by a schema in a single pass"""
+    def __init__(self, field: str, errors: list):
+        self.errors = errors
+        details = "; ".join(f"{error.field} ({error.value!r}): {error.reason}" for error in errors)
+        super().__init__(field, f"{len(errors)} violation(s)", details)
+
+# Callbacks that can take over Ctrl+C for the operation currently running
+_interrupt_callbacks: list = []
+
+def register_interrupt_callback(callback: Callable[[], bool]) -> None:
+    """Register a callback run on Ctrl+C; returning True cancels only that operation instead of exiting"""
+    _interrupt_callbacks.append(callback)
+
+def unregister_interrupt_callback(callback: Callable[[], bool]) -> None:
+    """Remove a previously registered interrupt callback"""
+    if callback in _interrupt_callbacks:
+        _interrupt_callbacks.remove(callback)
+
 # Error Handler Functions
 def handle_keyboard_interrupt(signum, frame):
     """Handle Ctrl+C gracefully"""
+    # Only Ctrl+C may be taken over by a running operation; SIGTERM must always terminate
+    callbacks = reversed(_interrupt_callbacks) if signum == signal.SIGINT else ()
+    for callback in callbacks:
+        try:
+            if callback():
+                console.print("\n[yellow]⚠️  Operation cancelled by user[/yellow]")
+                logger.info("User cancelled the running operation with Ctrl+C")
+                return
+        except Exception as e:
+            logger.error(f"Interrupt callback failed: {e}")
     console.print("\n[yellow]⚠️  Operation cancelled by user[/yellow]")
     logger.info("User interrupted the operation with Ctrl+C")
     sys.exit(0)
@@ -0,0 +1,231 @@
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("EventBus")
+
+# Core framework topics
+PLUGIN_LOADED = "plugin.loaded"
+PLUGIN_UNLOADED = "plugin.unloaded"
+PLUGIN_RELOADED = "plugin.reloaded"
+CONFIG_CHANGED = "config.changed"
+USER_INPUT = "user.input"
+
+_POLL_INTERVAL = 0.1  # Seconds a publisher blocked on a full queue waits before rechecking `active`
+_STOP = object()  # Queued by stop() to wake an idle worker
+
+class Event:
+    """A message published on the event bus"""
+
+    __slots__ = ("topic", "payload", "timestamp")
+
+    def __init__(self, topic: str, payload: Any = None):
+        self.topic = topic
+        self.payload = payload
+        self.timestamp = time.time()
+
+    def __repr__(self) -> str:
+        return f"Event({self.topic!r}, {self.payload!r})"
+
+class Subscription:
+    """A subscriber's registration for one topic"""
+
+    def __init__(self, bus: "EventBus", topic: str, callback: Callable, owner: Any = None,
+                 asynchronous: bool = False, max_queue: int = 1000, batch_size: int = 1,
+                 block: bool = True):
+        self.bus = bus
+        self.topic = topic
+        self.callback = callback
+        self.owner = owner
+        self.asynchronous = asynchronous
+        self.batch_size = batch_size
+        self.block = block  # Backpressure: block publishers when full, otherwise drop
+        self.delivered = 0
+        self.dropped = 0
+        self._count_lock = threading.Lock()
+        self.active = True
+        self.queue: Optional[queue.Queue] = queue.Queue(max_queue) if asynchronous else None
+        self._worker: Optional[threading.Thread] = None
+        if asynchronous:
+            self._worker = threading.Thread(target=self._run, name=f"EventBus-{topic}", daemon=True)
+            self._worker.start()
+
+    @property
+    def name(self) -> str:
+        if self.owner is not None:
+            return getattr(self.owner, "name", str(self.owner))
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+    def deliver(self, event: Event) -> None:
+        # Publishers iterate a copy-on-write snapshot, so this may run after unsubscribe
+        if not self.active:
+            return
+        if not self.asynchronous:
+            self._invoke([event] if self.batch_size > 1 else event)
+            return
+        if not self.block:
+            try:
+                self.queue.put_nowait(event)
+            except queue.Full:
+                self._count(dropped=1)
+            return
+        # Block while the queue is full, but give up once the worker has been stopped
+        while self.active:
+            try:
+                self.queue.put(event, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+        self._count(dropped=1)
+
+    def _count(self, delivered: int = 0, dropped: int = 0) -> None:
+        with self._count_lock:
+            self.delivered += delivered
+            self.dropped += dropped
+
+    def _invoke(self, item) -> None:
+        try:
+            self.callback(item)
+            self._count(delivered=len(item) if isinstance(item, list) else 1)
+        except Exception as e:
+            logger.error(f"Subscriber {self.name} failed on '{self.topic}': {e}")
+
+    def _run(self) -> None:
+        # Block until there is work; stop() wakes the worker with a sentinel
+        while True:
+            event = self.queue.get()
+            if event is _STOP or not self.active:
+                self.queue.task_done()
+                self._discard_pending()
+                return
+            batch = [event]
+            # Drain whatever else is already queued, up to batch_size, into one callback
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self.queue.task_done()
+                    break
+                batch.append(item)
+            if self.active:
+                self._invoke(batch if self.batch_size > 1 else event)
+            else:
+                self._count(dropped=len(batch))
+            for _ in batch:
+                self.queue.task_done()
+
+    def _discard_pending(self) -> None:
+        """Drop queued events so none reach a stopped subscriber"""
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._count(dropped=1)
+            self.queue.task_done()
+
+    def stop(self) -> None:
+        """Stop delivering; queued events are dropped and the worker exits.
+
+        Never blocks, so a subscriber may cancel itself from its own callback.
+        """
+        self.active = False
+        if not self.asynchronous:
+            return
+        self._discard_pending()
+        try:
+            self.queue.put_nowait(_STOP)
+        except queue.Full:
+            pass  # A racing publisher refilled the queue; the worker wakes on that event instead
+
+    def join(self) -> None:
+        """Wait until every queued event has been handled"""
+        if self.asynchronous:
+            self.queue.join()
+
+    def cancel(self) -> None:
+        """Remove the subscription and stop its worker"""
+        self.bus.unsubscribe(self)
+
+class EventBus:
+    """Topic-based publish/subscribe bus for plugin-to-plugin communication"""
+
+    def __init__(self):
+        self._topics: Dict[str, List[Subscription]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.published: Dict[str, int] = defaultdict(int)
+
+    def subscribe(self, topic: str, callback: Callable, owner: Any = None,
+                  asynchronous: bool = False, max_queue: int = 1000, batch_size: int = 1,
+                  block: bool = True) -> Subscription:
+        """Subscribe to a topic; '*' receives every event.
+
+        With batch_size > 1 the callback receives lists of events. Asynchronous
+        subscribers get their own bounded queue and worker thread.
+        """
+        subscription = Subscription(self, topic, callback, owner, asynchronous, max_queue, batch_size, block)
+        with self._lock:
+            # Copy-on-write so publish can iterate without holding the lock
+            self._topics[topic] = self._topics[topic] + [subscription]
+        logger.debug(f"Subscribed {subscription.name} to '{topic}'")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription"""
+        with self._lock:
+            subscribers = self._topics.get(subscription.topic, [])
+            if subscription in subscribers:
+                self._topics[subscription.topic] = [s for s in subscribers if s is not subscription]
+        subscription.stop()
+
+    def unsubscribe_owner(self, owner: Any) -> int:
+        """Remove every subscription registered by an owner (e.g. an unloaded plugin instance)"""
+        with self._lock:
+            subscriptions = [s for subs in self._topics.values() for s in subs if s.owner is owner]
+        for subscription in subscriptions:
+            self.unsubscribe(subscription)
+        return len(subscriptions)
+
+    def publish(self, topic: str, payload: Any = None) -> Event:
+        """Publish an event to the topic's subscribers and to wildcard subscribers"""
+        event = Event(topic, payload)
+        with self._lock:
+            self.published[topic] += 1
+        for subscription in self._topics.get(topic, ()):
+            subscription.deliver(event)
+        for subscription in self._topics.get("*", ()):
+            subscription.deliver(event)
+        return event
+
+    def subscribers(self, topic: str) -> List[Subscription]:
+        """List subscriptions of a topic"""
+        return list(self._topics.get(topic, ()))
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Published counts per topic plus per-subscriber delivery and drop counts"""
+        with self._lock:
+            subscriptions = [s for subs in self._topics.values() for s in subs]
+            published = dict(self.published)
+        return {
+            "published": published,
+            "subscribers": {
+                f"{s.name}@{s.topic}": {"delivered": s.delivered, "dropped": s.dropped}
+                for s in subscriptions
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop all asynchronous subscribers"""
+        with self._lock:
+            subscriptions = [s for subs in self._topics.values() for s in subs]
+        for subscription in subscriptions:
+            self.unsubscribe(subscription)
+
+# Global event bus instance
+event_bus = EventBus()
@@ -0,0 +1,248 @@
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from typing import Iterable, List, Optional
+from logger import ConSolarLogger
+
+try:
+    from prompt_toolkit import prompt as toolkit_prompt
+    from prompt_toolkit.completion import Completer, Completion
+    from prompt_toolkit.history import History
+except ImportError:
+    toolkit_prompt = None
+    Completer = History = object
+
+logger = ConSolarLogger("History")
+
+class HistoryStore:
+    """Command history in sqlite with a trigram FTS index, scoped by session and prompt"""
+
+    def __init__(self, db_path: str = os.path.join("cache", "history.sqlite3"),
+                 max_entries: int = 100000, prune_every: int = 100):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self.session = uuid.uuid4().hex[:12]
+        self.fts = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._appended = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use so startup never touches it"""
+        if self._conn is not None:
+            return self._conn
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " id INTEGER PRIMARY KEY, session TEXT, prompt TEXT, command TEXT, created REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_prompt ON entries (prompt, id)")
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+                " command, content='entries', content_rowid='id', tokenize='trigram')"
+            )
+            conn.executescript("""
+                CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+                    INSERT INTO entries_fts(rowid, command) VALUES (new.id, new.command);
+                END;
+                CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+                    INSERT INTO entries_fts(entries_fts, rowid, command) VALUES ('delete', old.id, old.command);
+                END;
+            """)
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            logger.debug(f"FTS5 trigram index unavailable, falling back to LIKE search: {e}")
+        self._conn = conn
+        return conn
+
+    def append(self, command: str, prompt: str = "default") -> None:
+        """Add an entry, skipping immediate repeats of the last command for the prompt"""
+        if not command.strip():
+            return
+        with self._lock:
+            conn = self._connect()
+            last = conn.execute("SELECT command FROM entries WHERE prompt=? ORDER BY id DESC LIMIT 1",
+                                (prompt,)).fetchone()
+            if last and last[0] == command:
+                return
+            conn.execute("INSERT INTO entries (session, prompt, command, created) VALUES (?, ?, ?, ?)",
+                         (self.session, prompt, command, time.time()))
+            self._appended += 1
+            if self._appended % self.prune_every == 0:
+                self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop the oldest entries beyond max_entries"""
+        row = conn.execute("SELECT id FROM entries ORDER BY id DESC LIMIT 1 OFFSET ?",
+                           (self.max_entries,)).fetchone()
+        if row:
+            conn.execute("DELETE FROM entries WHERE id <= ?", (row[0],))
+
+    def recent(self, prompt: Optional[str] = None, limit: int = 100, session: Optional[str] = None) -> List[str]:
+        """Newest entries first"""
+        sql, params = self._scope("SELECT command FROM entries", prompt, session)
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_recent(self, prompt: Optional[str] = None, page_size: int = 500,
+                    limit: Optional[int] = None) -> Iterable[str]:
+        """Yield entries newest first, fetching one page at a time"""
+        before = None
+        yielded = 0
+        while limit is None or yielded < limit:
+            sql, params = self._scope("SELECT id, command FROM entries", prompt, None)
+            if before is not None:
+                sql += (" AND" if params else " WHERE") + " id < ?"
+                params.append(before)
+            with self._lock:
+                rows = self._connect().execute(sql + " ORDER BY id DESC LIMIT ?", params + [page_size]).fetchall()
+            if not rows:
+                return
+            for row_id, command in rows:
+                yield command
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+            before = rows[-1][0]
+
+    @staticmethod
+    def _scope(sql: str, prompt: Optional[str], session: Optional[str]):
+        clauses, params = [], []
+        if prompt is not None:
+            clauses.append("prompt = ?")
+            params.append(prompt)
+        if session is not None:
+            clauses.append("session = ?")
+            params.append(session)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return sql, params
+
+    def search(self, query: str, prompt: Optional[str] = None, session: Optional[str] = None,
+               limit: int = 20) -> List[str]:
+        """Fuzzy search: substring hits (via the trigram index) first, then subsequence matches"""
+        query = query.strip()
+        if not query:
+            return self.recent(prompt, limit, session)
+        results: List[str] = []
+        seen = set()
+        with self._lock:
+            conn = self._connect()
+            if self.fts and len(query) >= 3:
+                # Materialize the index hits once instead of evaluating MATCH per row
+                sql = ("SELECT e.command FROM entries e WHERE e.id IN"
+                       " (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)")
+                params: list = ['"' + query.replace('"', '""') + '"']
+            else:
+                sql = "SELECT e.command FROM entries e WHERE e.command LIKE ? ESCAPE '\\'"
+                params = ["%" + self._escape_like(query) + "%"]
+            sql, params = self._scoped_join(sql, params, prompt, session)
+            rows = conn.execute(sql + " ORDER BY e.id DESC LIMIT ?", params + [limit * 4]).fetchall()
+            for (command,) in rows:
+                if command not in seen:
+                    seen.add(command)
+                    results.append(command)
+
+            if len(results) < limit:
+                # Characters in order with gaps, e.g. "gco" finds "git checkout"
+                pattern = "%" + "%".join(self._escape_like(c) for c in query) + "%"
+                sql, params = self._scoped_join(
+                    "SELECT e.command FROM entries e WHERE e.command LIKE ? ESCAPE '\\'", [pattern], prompt, session)
+                rows = conn.execute(sql + " ORDER BY e.id DESC LIMIT ?", params + [limit * 4]).fetchall()
+                fuzzy = [command for (command,) in rows if command not in seen]
+                fuzzy.sort(key=lambda command: self._gap_score(command, query))
+                for command in fuzzy:
+                    if command not in seen:
+                        seen.add(command)
+                        results.append(command)
+        return results[:limit]
+
+    @staticmethod
+    def _scoped_join(sql: str, params: list, prompt: Optional[str], session: Optional[str]):
+        if prompt is not None:
+            sql += " AND e.prompt = ?"
+            params.append(prompt)
+        if session is not None:
+            sql += " AND e.session = ?"
+            params.append(session)
+        return sql, params
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        return re.sub(r"([%_\\])", r"\\\1", text)
+
+    @staticmethod
+    def _gap_score(command: str, query: str) -> int:
+        """Total gap between matched characters; tighter matches rank first"""
+        lowered, position, gaps = command.lower(), -1, 0
+        for char in query.lower():
+            found = lowered.find(char, position + 1)
+            if found == -1:
+                return 1 << 30
+            if position >= 0:
+                gaps += found - position - 1
+            position = found
+        return gaps
+
+    def clear(self, prompt: Optional[str] = None) -> None:
+        sql, params = self._scope("DELETE FROM entries", prompt, None)
+        with self._lock:
+            self._connect().execute(sql, params)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+class SqliteHistory(History):
+    """prompt_toolkit History backed by HistoryStore; only the newest entries are preloaded"""
+
+    def __init__(self, store: HistoryStore, prompt: str = "default", preload: int = 1000):
+        super().__init__()
+        self.store = store
+        self.prompt = prompt
+        self.preload = preload
+
+    def load_history_strings(self) -> Iterable[str]:
+        return self.store.iter_recent(self.prompt, limit=self.preload)
+
+    def store_string(self, string: str) -> None:
+        self.store.append(string, self.prompt)
+
+class HistoryCompleter(Completer):
+    """Incremental fuzzy search over the whole history while typing"""
+
+    def __init__(self, store: HistoryStore, prompt: str = "default", limit: int = 10):
+        self.store = store
+        self.prompt = prompt
+        self.limit = limit
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        if not text.strip():
+            return
+        for command in self.store.search(text, self.prompt, limit=self.limit):
+            if command != text:
+                yield Completion(command, start_position=-len(text))
+
+def history_prompt(message: str, prompt_id: str = "default") -> str:
+    """Prompt with persistent, searchable history; plain input() when not on a terminal"""
+    if toolkit_prompt is not None and sys.stdin.isatty() and sys.stdout.isatty():
+        answer = toolkit_prompt(message, history=SqliteHistory(history_store, prompt_id),
+                                completer=HistoryCompleter(history_store, prompt_id),
+                                complete_while_typing=True, enable_history_search=False)
+        return answer
+    answer = input(message)
+    history_store.append(answer, prompt_id)
+    return answer
+
+# Global history store
+history_store = HistoryStore()
@@ -0,0 +1,260 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+from error_handler import ConSolarError
+from logger import ConSolarLogger
+from config_manager import ConfigManager, config_manager
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+except ImportError:
+    requests = HTTPAdapter = CaseInsensitiveDict = None
+
+logger = ConSolarLogger("HttpClient")
+
+# Request headers that change the response; they are part of the cache key so that, e.g.,
+# a response fetched with one Authorization is never served to a request with another
+CACHE_KEY_HEADERS = ("Accept", "Accept-Encoding", "Accept-Language", "Authorization", "Cookie")
+# Response headers a 304 Not Modified may update on the cached entry
+REVALIDATED_HEADERS = ("Cache-Control", "Date", "ETag", "Expires", "Last-Modified")
+
+def cache_directives(headers) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: value or None}"""
+    value = CaseInsensitiveDict(headers or {}).get("Cache-Control") or ""
+    directives = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') or None
+    return directives
+
+class ResponseCache:
+    """On-disk HTTP response cache honoring ETag/Last-Modified validators and Cache-Control.
+
+    Responses without a max-age are fresh for `ttl` seconds; no-cache entries
+    are revalidated on every use and no-store responses are never written.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Cache key of a URL plus the request headers that select its representation"""
+        headers = CaseInsensitiveDict(headers or {})
+        varying = [(name, headers[name]) for name in CACHE_KEY_HEADERS if name in headers]
+        return json.dumps([url, varying])
+
+    def _paths(self, key: str) -> tuple:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        base = os.path.join(self.cache_dir, digest)
+        return base + ".json", base + ".body"
+
+    def _write(self, path: str, data: bytes) -> None:
+        # Unique temp name per writer so concurrent fetches of one URL never replace each other's file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                meta["body"] = f.read()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, url: str, response) -> None:
+        if "no-store" in cache_directives(response.headers):
+            return
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": url,
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "stored": time.time(),
+        }
+        # Body first, then metadata, so a crash never leaves metadata pointing at a partial body
+        self._write(body_path, response.content)
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def touch(self, key: str, meta: Dict[str, Any], response=None) -> None:
+        """Mark a cached entry fresh again after a 304 Not Modified, taking its updated headers"""
+        meta_path, _ = self._paths(key)
+        meta = {k: v for k, v in meta.items() if k != "body"}
+        if response is not None:
+            headers = CaseInsensitiveDict(meta["headers"])
+            headers.update({name: response.headers[name] for name in REVALIDATED_HEADERS if name in response.headers})
+            meta["headers"] = dict(headers)
+        meta["stored"] = time.time()
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def is_fresh(self, meta: Dict[str, Any]) -> bool:
+        directives = cache_directives(meta["headers"])
+        if "no-cache" in directives or "no-store" in directives:
+            return False
+        lifetime = self.ttl
+        if "max-age" in directives:
+            try:
+                lifetime = int(directives["max-age"])
+            except (TypeError, ValueError):
+                return False  # Malformed max-age: treat as stale (RFC 9111, 4.2.1)
+        return time.time() - meta["stored"] < lifetime
+
+    def clear(self) -> None:
+        for name in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass  # Replaced or removed by a concurrent writer
+
+class HttpClient:
+    """Framework-owned HTTP service with per-host connection pools and an optional response cache"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        if requests is None:
+            raise ConSolarError("The requests package is required for the HTTP client (pip install requests)")
+        config = config or config_manager
+        self.pool_connections = config.get_nested("http.pool_connections", 10)
+        self.pool_maxsize = config.get_nested("http.pool_maxsize", 10)
+        self.max_retries = config.get_nested("http.max_retries", 2)
+        self.timeout = config.get_nested("http.timeout", 10.0)
+        self.max_workers = config.get_nested("http.max_workers", 8)
+        self.cache: Optional[ResponseCache] = None
+        if config.get_nested("http.cache_enabled", True):
+            self.cache = ResponseCache(config.get_nested("http.cache_dir", "cache/http"),
+                                       config.get_nested("http.cache_ttl", 300))
+        self.sessions: Dict[str, "requests.Session"] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> "requests.Session":
+        """Get (or create) the pooled session for a URL's scheme and host"""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        session = self.sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self.sessions.get(host)
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                          pool_maxsize=self.pool_maxsize, max_retries=self.max_retries)
+                    session.mount(host, adapter)
+                    self.sessions[host] = session
+                    logger.debug(f"Opened connection pool for {host}")
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request through the host's pooled session"""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def get(self, url: str, use_cache: bool = True, **kwargs) -> "requests.Response":
+        """GET a URL, serving fresh cached copies and revalidating stale ones"""
+        # Per-request credentials outside the headers cannot be keyed safely, so skip the cache
+        request_directives = cache_directives(kwargs.get("headers"))
+        if (self.cache is None or not use_cache or kwargs.get("params")
+                or kwargs.get("auth") or kwargs.get("cookies") or "no-store" in request_directives):
+            return self.request("GET", url, **kwargs)
+
+        key = self.cache.key(url, kwargs.get("headers"))
+        cached = self.cache.load(key)
+        if cached and "no-cache" not in request_directives and self.cache.is_fresh(cached):
+            self.cache.hits += 1
+            return self._from_cache(url, cached)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached:
+            cached_headers = CaseInsensitiveDict(cached["headers"])
+            if "ETag" in cached_headers:
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        response = self.request("GET", url, headers=headers, **kwargs)
+        if response.status_code == 304 and cached:
+            self.cache.revalidated += 1
+            self.cache.touch(key, cached, response)
+            return self._from_cache(url, cached)
+        self.cache.misses += 1
+        if response.status_code == 200:
+            self.cache.store(key, url, response)
+        return response
+
+    def post(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("POST", url, **kwargs)
+
+    @staticmethod
+    def _from_cache(url: str, meta: Dict[str, Any]) -> "requests.Response":
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = meta["body"]
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def fetch_many(self, urls: List[str], max_workers: Optional[int] = None,
+                   **kwargs) -> Dict[str, Union["requests.Response", Exception]]:
+        """GET many URLs concurrently with bounded parallelism; failures are returned, not raised.
+
+        Each distinct URL is fetched once, however often it is listed.
+        """
+        def fetch(url):
+            try:
+                return self.get(url, **kwargs)
+            except Exception as e:
+                logger.warning(f"Fetch failed for {url}: {e}")
+                return e
+
+        unique = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            return dict(zip(unique, executor.map(fetch, unique)))
+
+    def stats(self) -> Dict[str, int]:
+        """Pool and cache statistics"""
+        result = {"pools": len(self.sessions)}
+        if self.cache:
+            result.update(hits=self.cache.hits, revalidated=self.cache.revalidated, misses=self.cache.misses)
+        return result
+
+    def close(self) -> None:
+        """Close every pooled session"""
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+_http_client: Optional[HttpClient] = None
+
+def get_http_client() -> HttpClient:
+    """Shared framework HTTP client, created on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
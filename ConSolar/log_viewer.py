@@ -0,0 +1,281 @@
+import argparse
+import fnmatch
+import mmap
+import os
+import re
+import threading
+import time
+from typing import Iterator, List, Optional, Sequence
+from rich.console import Console
+from rich.text import Text
+from error_handler import register_interrupt_callback, unregister_interrupt_callback
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("LogViewer")
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LEVEL_STYLES = {"DEBUG": "dim", "INFO": "cyan", "WARNING": "yellow", "ERROR": "red", "CRITICAL": "bold red"}
+
+# Matches the file handler format in logger.py: "%(asctime)s - %(name)s - %(levelname)s - %(message)s".
+# Lines that do not match (tracebacks, multi-line messages) belong to the record above them.
+RECORD_HEADER = re.compile(
+    rb"(?P<time>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (?P<name>.*?) - (?P<level>"
+    + b"|".join(level.encode() for level in LEVELS) + rb") - "
+)
+
+class LogRecord:
+    """One record parsed from the log file, including its continuation lines"""
+
+    __slots__ = ("offset", "raw", "time", "name", "level", "message")
+
+    def __init__(self, offset: int, raw: bytes):
+        self.offset = offset
+        self.raw = raw
+        header = RECORD_HEADER.match(raw)
+        if header:
+            self.time = header.group("time").decode()
+            self.name = header.group("name").decode("utf-8", "replace")
+            self.level = header.group("level").decode()
+            self.message = raw[header.end():].decode("utf-8", "replace").rstrip("\n")
+        else:
+            # Orphaned continuation lines at the very start of the file
+            self.time, self.name, self.level = "", "", ""
+            self.message = raw.decode("utf-8", "replace").rstrip("\n")
+
+    @property
+    def text(self) -> str:
+        return self.raw.decode("utf-8", "replace").rstrip("\n")
+
+    def __repr__(self) -> str:
+        return f"LogRecord(offset={self.offset}, level={self.level!r}, name={self.name!r})"
+
+class LogFilter:
+    """Level/logger/text filter compiled once and applied to every record"""
+
+    def __init__(self, min_level: Optional[str] = None, loggers: Optional[Sequence[str]] = None,
+                 pattern: Optional[str] = None, ignore_case: bool = False):
+        min_level = (min_level or "DEBUG").upper()
+        if min_level not in LEVELS:
+            raise ValueError(f"Unknown log level '{min_level}'")
+        self.levels = frozenset(LEVELS[LEVELS.index(min_level):])
+        self._level_bytes = frozenset(level.encode() for level in self.levels)
+        # Logger names accept shell-style globs ("Plugin*"); translate them into one regex
+        self.logger_pattern = (re.compile("|".join(fnmatch.translate(name) for name in loggers))
+                               if loggers else None)
+        self._logger_bytes = re.compile(self.logger_pattern.pattern.encode()) if loggers else None
+        self.text_pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0) if pattern else None
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.levels) == len(LEVELS) and self.logger_pattern is None and self.text_pattern is None
+
+    def accepts_header(self, header) -> bool:
+        """Cheap check on a raw header match, before the record is decoded"""
+        if header.group("level") not in self._level_bytes:
+            return False
+        return self._logger_bytes is None or self._logger_bytes.match(header.group("name")) is not None
+
+    def matches(self, record: LogRecord) -> bool:
+        if record.level and record.level not in self.levels:
+            return False
+        if self.logger_pattern is not None and not self.logger_pattern.match(record.name):
+            return False
+        if self.text_pattern is not None and not self.text_pattern.search(record.message):
+            return False
+        return True
+
+class LogViewer:
+    """Tails and follows a log file without reading it whole.
+
+    tail() memory-maps the file and walks backwards from the end one line at
+    a time, so its cost depends on how many records are shown, not on the
+    file size. follow() polls the file for appends and reopens it after
+    rotation (inode change) or truncation (size shrinks).
+    """
+
+    def __init__(self, path: str, console: Optional[Console] = None):
+        self.path = path
+        self.console = console or Console()
+
+    def tail(self, count: int = 50, log_filter: Optional[LogFilter] = None) -> List[LogRecord]:
+        """Return the last `count` records that pass the filter, oldest first"""
+        if count <= 0:
+            return []
+        try:
+            with open(self.path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    return self._scan_backwards(view, count, log_filter)
+        except FileNotFoundError:
+            return []
+
+    def _scan_backwards(self, view: mmap.mmap, count: int, log_filter: Optional[LogFilter]) -> List[LogRecord]:
+        records: List[LogRecord] = []
+        # A trailing partial line is still being written; leave it for follow()
+        last_newline = view.rfind(b"\n")
+        if last_newline == -1:
+            return []
+        end = last_newline + 1
+        record_end = end
+        position = end - 1
+        while position > 0 and len(records) < count:
+            line_start = view.rfind(b"\n", 0, position) + 1
+            header = RECORD_HEADER.match(view, line_start)
+            if header or line_start == 0:
+                if log_filter is None or header is None or log_filter.accepts_header(header):
+                    record = LogRecord(line_start, view[line_start:record_end])
+                    if log_filter is None or log_filter.matches(record):
+                        records.append(record)
+                record_end = line_start
+            position = line_start - 1
+        records.reverse()
+        return records
+
+    def follow(self, log_filter: Optional[LogFilter] = None, interval: float = 0.5,
+               from_start: bool = False, idle_flush: float = 1.0,
+               stop: Optional[threading.Event] = None) -> Iterator[LogRecord]:
+        """Yield records as they are appended to the file, until `stop` is set.
+
+        A record is emitted once the next record header arrives, or after
+        `idle_flush` seconds without new data, so tracebacks stay attached
+        to the record that logged them.
+        """
+        handle = None
+        inode = None
+        offset = 0
+        partial = b""
+        pending: Optional[LogRecord] = None
+        last_data = time.monotonic()
+        stop = stop or threading.Event()
+        try:
+            while not stop.is_set():
+                records: List[LogRecord] = []
+                try:
+                    stat = os.stat(self.path)
+                except FileNotFoundError:
+                    stat = None  # Rotated away and not recreated yet
+                if stat is not None and (handle is None or stat.st_ino != inode):
+                    if handle is not None:
+                        # Drain what was written to the old file before it was rotated
+                        records, offset, partial, pending = self._consume(handle, offset, partial, pending)
+                        if partial:
+                            records, pending = self._group([partial], pending, offset - len(partial), records)
+                        if pending is not None:
+                            records.append(pending)
+                        handle.close()
+                        pending, partial = None, b""
+                        logger.debug(f"Log file {self.path} rotated, reopening")
+                    handle = open(self.path, "rb")
+                    inode = os.fstat(handle.fileno()).st_ino
+                    offset = 0 if from_start else self._last_line_end(handle, stat.st_size)
+                    from_start = True  # Every file opened after the first one is new data
+                elif stat is not None and stat.st_size < offset:
+                    logger.debug(f"Log file {self.path} truncated, rereading from the start")
+                    offset, partial = 0, b""
+
+                if handle is not None:
+                    previous = offset
+                    new_records, offset, partial, pending = self._consume(handle, offset, partial, pending)
+                    records.extend(new_records)
+                    if offset != previous:
+                        last_data = time.monotonic()
+                    elif pending is not None and time.monotonic() - last_data >= idle_flush:
+                        records.append(pending)
+                        pending = None
+                for record in records:
+                    if log_filter is None or log_filter.matches(record):
+                        yield record
+                stop.wait(interval)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def _last_line_end(self, handle, size: int, window: int = 65536) -> int:
+        """Offset just past the last complete line, so a half-written line is read whole later"""
+        start = max(0, size - window)
+        handle.seek(start)
+        newline = handle.read(size - start).rfind(b"\n")
+        return start + newline + 1 if newline != -1 else start
+
+    def _consume(self, handle, offset: int, partial: bytes, pending: Optional[LogRecord]):
+        """Read everything appended since `offset` and group it into records"""
+        handle.seek(offset)
+        data = handle.read()
+        if not data:
+            return [], offset, partial, pending
+        offset += len(data)
+        lines = (partial + data).split(b"\n")
+        partial = lines.pop()
+        records, pending = self._group(lines, pending, offset - len(partial) - sum(len(line) + 1 for line in lines))
+        return records, offset, partial, pending
+
+    def _group(self, lines: List[bytes], pending: Optional[LogRecord], offset: int,
+               complete: Optional[List[LogRecord]] = None):
+        """Group complete lines into records; the last record stays pending"""
+        complete = complete if complete is not None else []
+        for line in lines:
+            raw = line + b"\n"
+            if pending is None or RECORD_HEADER.match(raw):
+                if pending is not None:
+                    complete.append(pending)
+                pending = LogRecord(offset, raw)
+            else:
+                pending = LogRecord(pending.offset, pending.raw + raw)
+            offset += len(raw)
+        return complete, pending
+
+    def render(self, record: LogRecord) -> Text:
+        """Colour a record by level for the console"""
+        text = Text(record.text)
+        style = LEVEL_STYLES.get(record.level)
+        if style:
+            text.stylize(style)
+        return text
+
+    def show(self, count: int = 50, log_filter: Optional[LogFilter] = None, follow: bool = False,
+             interval: float = 0.5) -> None:
+        """Print the last records, then optionally keep printing new ones until Ctrl+C"""
+        for record in self.tail(count, log_filter):
+            self.console.print(self.render(record), highlight=False, markup=False)
+        if not follow:
+            return
+        stop = threading.Event()
+
+        def _stop_following() -> bool:
+            stop.set()
+            return True  # Ctrl+C only ends following; the app keeps running
+
+        register_interrupt_callback(_stop_following)
+        try:
+            for record in self.follow(log_filter, interval=interval, stop=stop):
+                self.console.print(self.render(record), highlight=False, markup=False)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            unregister_interrupt_callback(_stop_following)
+
+def default_log_path() -> str:
+    """Log file configured for the framework's file handler"""
+    from config_manager import config_manager
+    log_dir = config_manager.get_nested("logging.log_dir", "logs")
+    log_file = config_manager.get_nested("logging.log_file", "consolar.log")
+    return os.path.join(log_dir, log_file)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show and follow the ConSolar log file")
+    parser.add_argument("path", nargs="?", help="Log file (default: from config)")
+    parser.add_argument("-n", "--lines", type=int, default=50, help="Number of records to show")
+    parser.add_argument("-f", "--follow", action="store_true", help="Keep printing new records")
+    parser.add_argument("-l", "--level", choices=LEVELS, type=str.upper, help="Minimum level")
+    parser.add_argument("--logger", action="append", help="Logger name or glob (repeatable)")
+    parser.add_argument("-g", "--grep", help="Regex matched against the message")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="Case-insensitive --grep")
+    parser.add_argument("--interval", type=float, default=0.5, help="Follow polling interval in seconds")
+    args = parser.parse_args()
+    log_filter = LogFilter(args.level, args.logger, args.grep, args.ignore_case)
+    viewer = LogViewer(args.path or default_log_path())
+    viewer.show(args.lines, None if log_filter.is_empty else log_filter, args.follow, args.interval)
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import logging
 import os
+import threading
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple
 from rich.console import Console
 from rich.logging import RichHandler
 
@@ -91,6 +93,36 @@ class ConSolarLogger:
             msg += f" - {details}"
         self.info(msg)
 
+class RingBufferHandler(logging.Handler):
+    """Logging handler that keeps only the most recent records in a bounded ring buffer"""
+
+    def __init__(self, capacity: int = 5000, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records = deque(maxlen=capacity)
+        self.sequence = 0  # Total records ever emitted, used by readers to fetch only new ones
+        self._buffer_lock = threading.Lock()
+        self.setFormatter(logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%H:%M:%S"
+        ))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._buffer_lock:
+            self.sequence += 1
+            self.records.append((self.sequence, record))
+
+    def since(self, sequence: int) -> Tuple[int, List[logging.LogRecord]]:
+        """Return (latest sequence, records newer than the given sequence)"""
+        with self._buffer_lock:
+            if sequence >= self.sequence:
+                return self.sequence, []
+            missing = self.sequence - sequence
+            if missing >= len(self.records):
+                new = [record for _, record in self.records]
+            else:
+                new = [record for _, record in list(self.records)[-missing:]]
+            return self.sequence, new
+
 # Legacy support - keep the old function but mark as deprecated
 def log(target, show_target, repeat: int = 1) -> None:
     """Legacy log function - DEPRECATED. Use ConSolarLogger instead."""
@@ -8,6 +8,8 @@ from core import *
 from plugin_manger import plugin_manager
 from logger import ConSolarLogger
 from config_manager import config_manager
+from plugin_stats import plugin_accounting
+from history import history_prompt, history_store
 
 logger = ConSolarLogger("ConSolar")
 
@@ -21,6 +23,11 @@ def main():
     print("-" * 50)
     
     # Load plugins
+    config_manager.load_config()
+    history_store.max_entries = config_manager.get_nested("history.max_entries", history_store.max_entries)
+    accounting = config_manager.get_nested("plugins.accounting", {}) or {}
+    if accounting.get("enabled"):
+        plugin_accounting.enable(track_memory=accounting.get("track_memory", False))
     try:
         plugin_manager.load_all_plugins()
         print(f"✅ Loaded {len(plugin_manager.plugins)} plugins")
@@ -34,9 +41,12 @@ def main():
             print("1. List loaded plugins")
             print("2. Test user input")
             print("3. Test multi-choice")
-            print("4. Exit")
+            print("4. Open dashboard")
+            print("5. Top plugins (resource usage)")
+            print("6. View log")
+            print("7. Exit")
             
-            choice = input("Select option (1-4): ").strip()
+            choice = history_prompt("Select option (1-7): ", prompt_id="main-menu").strip()
             
             if choice == "1":
                 plugins = plugin_manager.list_plugins()
@@ -57,11 +67,34 @@ def main():
                 print(f"You selected: {user.user_value}")
                 
             elif choice == "4":
+                from dashboard import run_dashboard
+                run_dashboard(plugin_manager, config_manager)
+                
+            elif choice == "5":
+                if not plugin_accounting.enabled:
+                    print("\nℹ️  Plugin accounting is off. Set CONSOLAR_PLUGIN_STATS=1 or plugins.accounting in the config.")
+                else:
+                    sort_by = input("Sort by (wall/cpu/calls/memory) [wall]: ").strip().lower() or "wall"
+                    if sort_by not in ("wall", "cpu", "calls", "memory"):
+                        sort_by = "wall"
+                    print(plugin_accounting.render_report(sort_by))
+                
+            elif choice == "6":
+                from log_viewer import LogViewer, LogFilter, LEVELS, default_log_path
+                level = input("Minimum level (DEBUG/INFO/WARNING/ERROR/CRITICAL) [DEBUG]: ").strip().upper() or "DEBUG"
+                if level not in LEVELS:
+                    level = "DEBUG"
+                follow = input("Follow new records? (y/N): ").strip().lower() == "y"
+                if follow:
+                    print("Following the log, press Ctrl+C to stop.")
+                LogViewer(default_log_path()).show(50, LogFilter(level), follow=follow)
+                
+            elif choice == "7":
                 print("👋 Goodbye!")
                 break
                 
             else:
-                print("❌ Invalid choice. Please select 1-4.")
+                print("❌ Invalid choice. Please select 1-7.")
                 
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted by user. Goodbye!")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+ConSolar Framework - Plugin Bundles
+Packs a plugin directory into a single zip of precompiled bytecode plus a manifest,
+which the PluginManager mounts through zipimport.
+
+Usage: python plugin_bundle.py <plugin_dir> [output.zip]
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import marshal
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+from typing import Any, Dict, Optional
+from error_handler import PluginError
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("PluginBundle")
+
+MANIFEST_NAME = "consolar_bundle.json"
+BUNDLE_FORMAT = 1
+
+def _bytecode(source: str, filename: str, mtime: int) -> bytes:
+    """Compile source into the .pyc layout understood by zipimport"""
+    code = compile(source, filename, "exec", dont_inherit=True)
+    header = importlib.util.MAGIC_NUMBER + struct.pack("<III", 0, mtime & 0xFFFFFFFF, len(source.encode()) & 0xFFFFFFFF)
+    return header + marshal.dumps(code)
+
+def _module_metadata(tree: ast.Module) -> Dict[str, Any]:
+    """Read __version__, __dependencies__ and plugin classes without importing the module"""
+    metadata: Dict[str, Any] = {"version": None, "dependencies": [], "classes": {}}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in ("__version__", "__dependencies__"):
+                    try:
+                        value = ast.literal_eval(node.value)
+                    except ValueError:
+                        continue
+                    key = "version" if target.id == "__version__" else "dependencies"
+                    metadata[key] = value
+        elif isinstance(node, ast.ClassDef):
+            bases = [ast.unparse(base) if hasattr(ast, "unparse") else "" for base in node.bases]
+            if any("Plugin" in base for base in bases):
+                metadata["classes"][node.name] = {
+                    "description": (ast.get_docstring(node) or "").strip(),
+                }
+    return metadata
+
+def build_plugin_bundle(plugin_dir: str, output_path: Optional[str] = None,
+                        bundle_name: Optional[str] = None) -> str:
+    """Build a zip bundle with precompiled bytecode and a manifest from a plugin directory"""
+    if not os.path.isdir(plugin_dir):
+        raise PluginError(plugin_dir, "Plugin directory does not exist")
+
+    bundle_name = bundle_name or os.path.basename(os.path.abspath(plugin_dir))
+    package = "consolar_bundle_" + re.sub(r"\W", "_", bundle_name)
+    output_path = output_path or os.path.abspath(plugin_dir).rstrip(os.sep) + ".zip"
+
+    manifest: Dict[str, Any] = {
+        "format": BUNDLE_FORMAT,
+        "name": bundle_name,
+        "package": package,
+        "magic": importlib.util.MAGIC_NUMBER.hex(),
+        "built": time.time(),
+        "modules": {},
+        "plugins": {},
+    }
+
+    tmp_path = output_path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr(f"{package}/__init__.pyc", _bytecode("", f"{package}/__init__.py", 0))
+        for file in sorted(os.listdir(plugin_dir)):
+            if not file.endswith(".py") or file.startswith("__"):
+                continue
+            module_name = file[:-3]
+            file_path = os.path.join(plugin_dir, file)
+            with open(file_path, "r", encoding="utf-8") as f:
+                source = f.read()
+            try:
+                tree = ast.parse(source, file_path)
+                data = _bytecode(source, f"{output_path}/{package}/{file}", int(os.stat(file_path).st_mtime))
+            except SyntaxError as e:
+                raise PluginError(module_name, f"Cannot compile for bundle: {e}") from e
+            bundle.writestr(f"{package}/{module_name}.pyc", data)
+
+            metadata = _module_metadata(tree)
+            manifest["modules"][module_name] = f"{package}.{module_name}"
+            for class_name, info in metadata["classes"].items():
+                manifest["plugins"][class_name] = {
+                    "module": module_name,
+                    "version": str(metadata["version"] or "unknown"),
+                    "dependencies": list(metadata["dependencies"]),
+                    "description": info["description"],
+                }
+        bundle.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Built plugin bundle {output_path} with {len(manifest['modules'])} modules")
+    return output_path
+
+def read_bundle_manifest(bundle_path: str) -> Optional[Dict[str, Any]]:
+    """Read a bundle's manifest, returning None if the file is not a usable bundle"""
+    try:
+        with zipfile.ZipFile(bundle_path) as bundle:
+            manifest = json.loads(bundle.read(MANIFEST_NAME))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    if manifest.get("format") != BUNDLE_FORMAT:
+        logger.warning(f"Unsupported bundle format in {bundle_path}")
+        return None
+    if manifest.get("magic") != importlib.util.MAGIC_NUMBER.hex():
+        logger.warning(f"Bundle {bundle_path} was built for a different Python version, rebuild it")
+        return None
+    return manifest
+
+def mount_bundle(bundle_path: str) -> None:
+    """Make a bundle importable (zipimport handles zip entries on sys.path)"""
+    bundle_path = os.path.abspath(bundle_path)
+    if bundle_path not in sys.path:
+        sys.path.append(bundle_path)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a ConSolar plugin bundle")
+    parser.add_argument("plugin_dir", help="Directory containing plugin .py files")
+    parser.add_argument("output", nargs="?", help="Output zip path (default: <plugin_dir>.zip)")
+    parser.add_argument("--name", help="Bundle name (default: directory name)")
+    args = parser.parse_args()
+    print(build_plugin_bundle(args.plugin_dir, args.output, args.name))
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,23 @@
 
+import hashlib
 import importlib
+import importlib.util
 import os
 import sys
-from typing import List, Type
+import threading
+import time
+from typing import Dict, List, Optional, Type
 from error_handler import safe_execute, PluginError
 from logger import ConSolarLogger
+from snapshot import startup_snapshot
+from dependency_resolver import Requirement, dependency_resolver
+from plugin_bundle import read_bundle_manifest, mount_bundle
+from progress import progress
+from event_bus import EventBus, event_bus, PLUGIN_LOADED, PLUGIN_UNLOADED, PLUGIN_RELOADED
+from shared_store import shared_store
+from cache_manager import cache_manager
+from scheduler import scheduler
+from plugin_stats import plugin_accounting
 
 logger = ConSolarLogger("PluginManager")
 
@@ -15,10 +28,18 @@ class Plugin:
 
 # Plugin Manager
 class PluginManager:
-    def __init__(self, plugin_dir: str = "plugins"):
+    def __init__(self, plugin_dir: str = "plugins", bus: Optional[EventBus] = None):
         self.plugin_dir = plugin_dir
         self.plugins: List[Plugin] = []
+        self.event_bus = bus or event_bus
         self.discovered_modules: List[str] = []
+        self.bundle_modules: Dict[str, tuple] = {}  # module -> (bundle path, import path)
+        self.module_sources: Dict[str, tuple] = {}  # module -> (mtime_ns, size, sha256 or None until watched)
+        self._registry_lock = threading.RLock()
+        self._staging: Optional[tuple] = None  # (thread id, staged plugin list) during a hot reload
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self.dependencies_validated = False  # Set on warm start from a validated snapshot
         logger.debug(f"PluginManager initialized with directory: {self.plugin_dir}")
 
     def discover_plugins(self) -> None:
@@ -28,62 +49,219 @@ class PluginManager:
             logger.warning(f"Plugin directory does not exist: {self.plugin_dir}")
             return
 
+        bundles = []
         for file in os.listdir(self.plugin_dir):
             if file.endswith(".py") and not file.startswith("__"):
                 module_name = file[:-3]  # Strip .py extension
                 self.discovered_modules.append(module_name)
+            elif file.endswith(".zip"):
+                bundles.append(os.path.join(self.plugin_dir, file))
+
+        # Bundles are described by their manifest, so their sources are never scanned
+        for bundle_path in sorted(bundles):
+            manifest = read_bundle_manifest(bundle_path)
+            if manifest is None:
+                continue
+            mount_bundle(bundle_path)
+            for module_name, import_path in manifest["modules"].items():
+                if module_name in self.discovered_modules:
+                    logger.debug(f"Loose plugin '{module_name}' shadows the one in {bundle_path}")
+                    continue
+                self.bundle_modules[module_name] = (bundle_path, import_path)
+                self.discovered_modules.append(module_name)
+            logger.debug(f"Discovered plugin bundle: {bundle_path}")
+
+    @staticmethod
+    def _module_origin(module_path: str) -> Optional[str]:
+        """Source file a module will be imported from, without importing it"""
+        try:
+            spec = importlib.util.find_spec(module_path)
+        except (ImportError, ValueError):
+            return None
+        return spec.origin if spec else None
+
+    @staticmethod
+    def _class_file(cls: type) -> Optional[str]:
+        if not plugin_accounting.track_memory:
+            return None
+        return getattr(sys.modules.get(cls.__module__), "__file__", None)
+
+    def _module_path(self, module_name: str) -> str:
+        """Import path of a discovered plugin module, loose file or bundled"""
+        if module_name in self.bundle_modules:
+            return self.bundle_modules[module_name][1]
+        return f"{self.plugin_dir}.{module_name}"
 
     @safe_execute(show_traceback=True)
     def load_discovered_plugins(self) -> None:
         """Load all discovered plugin modules"""
-        for module_name in self.discovered_modules:
+        candidates = []
+        for module_name in progress.track(self.discovered_modules, "Loading plugins"):
             logger.info(f"Loading plugin module: {module_name}")
             try:
-                module_path = f"{self.plugin_dir}.{module_name}"
-                module = importlib.import_module(module_path)
-                self._register_plugin(module)
+                module_path = self._module_path(module_name)
+                scope = self._module_origin(module_path) if plugin_accounting.track_memory else None
+                with plugin_accounting.measure(module_path, "import", scope_file=scope):
+                    module = importlib.import_module(module_path)
+                candidates.extend(self._plugin_classes(module))
+                self._record_source(module_path)
             except Exception as e:
                 logger.error(f"Failed to load plugin '{module_name}': {e}")
+        self._register_resolved(candidates)
+
+    @staticmethod
+    def _plugin_classes(module) -> List[type]:
+        """Plugin classes defined in a module (imported base classes are skipped)"""
+        return [
+            attr for attr in vars(module).values()
+            if isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin
+            and attr.__module__ == module.__name__
+        ]
+
+    def _register_resolved(self, candidates: List[type]) -> None:
+        """Pick one version per plugin with the dependency resolver and register in dependency order"""
+        manifest: Dict[str, Dict[str, List[str]]] = {}
+        classes: Dict[tuple, type] = {}
+        for plugin in self.plugins:  # Already registered plugins are fixed candidates
+            manifest[plugin.__class__.__name__] = {
+                str(getattr(plugin, "version", "0")): list(getattr(plugin, "dependencies", []))
+            }
+        registered = set(manifest)
+        for cls in candidates:
+            if cls.__name__ in registered:
+                continue
+            try:
+                version, dependencies = plugin_metadata(cls)
+            except Exception as e:
+                logger.error(f"Plugin '{cls.__name__}' skipped: invalid version or dependency declaration ({e})")
+                continue
+            manifest.setdefault(cls.__name__, {})[version] = dependencies
+            classes[(cls.__name__, version)] = cls
 
-    def _register_plugin(self, module) -> None:
-        """Register a plugin module"""
         try:
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin:
-                    plugin_instance = attr()
+            resolution = dependency_resolver.resolve(manifest)
+        except Exception as e:
+            logger.error(f"Dependency resolution failed: {getattr(e, 'message', e)}")
+            return
+        for conflict in resolution.conflicts:
+            logger.error(f"Plugin skipped due to dependency conflict - {conflict}")
+
+        for name in resolution.order:
+            cls = classes.get((name, resolution.selected[name]))
+            if cls is None:
+                continue
+            try:
+                with plugin_accounting.measure(name, "register", cls.__module__, self._class_file(cls)):
+                    plugin_instance = cls()
                     plugin_instance.register(self)
-                    self.plugins.append(plugin_instance)
-                    logger.info(f"Registered plugin: {attr_name}")
+                plugin_accounting.instrument(plugin_instance)
+                self.plugins.append(plugin_instance)
+                logger.info(f"Registered plugin: {name}")
+                self.event_bus.publish(PLUGIN_LOADED, {"name": name, "plugin": plugin_instance})
+            except Exception as e:
+                logger.error(f"Failed to register plugin '{name}': {e}")
+
+    def _register_plugin(self, module, target: Optional[List[Plugin]] = None) -> None:
+        """Register a plugin module, appending its plugins to `target` (the live registry by default)"""
+        target = self.plugins if target is None else target
+        attr_name = module.__name__
+        try:
+            for attr in self._plugin_classes(module):
+                attr_name = attr.__name__
+                with plugin_accounting.measure(attr_name, "register", attr.__module__, self._class_file(attr)):
+                    plugin_instance = attr()
+                    try:
+                        plugin_instance.register(self)
+                    except Exception:
+                        # register() may have scheduled jobs or subscribed before failing
+                        self._release_plugin(plugin_instance)
+                        raise
+                plugin_accounting.instrument(plugin_instance)
+                target.append(plugin_instance)
+                logger.info(f"Registered plugin: {attr_name}")
         except Exception as e:
             raise PluginError(attr_name, str(e)) from e
 
     def unload_plugin(self, plugin: Plugin) -> None:
         """Unload a plugin"""
         try:
-            plugin.unregister()
+            with plugin_accounting.measure(plugin.__class__.__name__, "unregister", plugin.__module__):
+                plugin.unregister()
             self.plugins.remove(plugin)
+            self.event_bus.unsubscribe_owner(plugin)
+            shared_store.release_owner(plugin)
+            cache_manager.clear_namespace(plugin.__class__.__name__)
             logger.info(f"Unloaded plugin: {plugin.__class__.__name__}")
+            self.event_bus.publish(PLUGIN_UNLOADED, {"name": plugin.__class__.__name__, "plugin": plugin})
         except Exception as e:
             logger.error(f"Error unloading plugin {plugin}: {e}")
 
+    def _visible_plugins(self) -> List[Plugin]:
+        """Registry as seen by the caller; plugins registering during a hot reload see the staged list"""
+        staging = self._staging
+        if staging is not None and staging[0] == threading.get_ident():
+            return staging[1]
+        return self.plugins
+
     def get_plugin_by_name(self, name: str) -> Plugin:
         """Get a plugin by its class name"""
-        for plugin in self.plugins:
+        for plugin in self._visible_plugins():
             if plugin.__class__.__name__ == name:
                 return plugin
         raise PluginError(name, "Plugin not found")
 
     def list_plugins(self) -> List[str]:
         """List all loaded plugin names"""
-        return [plugin.__class__.__name__ for plugin in self.plugins]
+        with self._registry_lock:
+            return [plugin.__class__.__name__ for plugin in self._visible_plugins()]
 
-    def load_all_plugins(self) -> None:
-        """Discover and load all plugins in one call"""
-        self.discover_plugins()
-        self.load_discovered_plugins()
+    def load_all_plugins(self, use_snapshot: bool = True) -> None:
+        """Discover and load all plugins in one call, warm-starting from a snapshot when possible"""
+        start = time.perf_counter()
+        fingerprint = startup_snapshot.fingerprint([self.plugin_dir])
+        snapshot = startup_snapshot.load("plugins", fingerprint) if use_snapshot else None
+
+        if snapshot is not None:
+            # Fast path: reuse the resolved order and skip discovery and dependency checks
+            self.discovered_modules = list(snapshot["order"])
+            for module_name, (bundle_path, import_path) in snapshot.get("bundles", {}).items():
+                mount_bundle(bundle_path)
+                self.bundle_modules[module_name] = (bundle_path, import_path)
+            self.dependencies_validated = True
+            try:
+                self.load_discovered_plugins()
+            finally:
+                self.dependencies_validated = False
+            if sorted(self.list_plugins()) != sorted(snapshot["manifest"]):
+                logger.warning("Plugin set differs from startup snapshot, invalidating it")
+                startup_snapshot.invalidate("plugins")
+            startup_snapshot.record_timing("plugins", "warm", time.perf_counter() - start)
+        else:
+            self.discover_plugins()
+            self.load_discovered_plugins()
+            if use_snapshot:
+                startup_snapshot.save("plugins", fingerprint, self._build_snapshot())
+            startup_snapshot.record_timing("plugins", "cold", time.perf_counter() - start)
         logger.info(f"Loaded {len(self.plugins)} plugins total")
 
+    def _build_snapshot(self) -> Dict[str, dict]:
+        """Collect the resolved module order, manifest metadata and dependency graph"""
+        order: List[str] = []
+        manifest: Dict[str, dict] = {}
+        for plugin in self.plugins:
+            module_name = plugin.__module__.rsplit(".", 1)[-1]
+            if module_name not in order:
+                order.append(module_name)
+            manifest[plugin.__class__.__name__] = {
+                "module": module_name,
+                "version": str(getattr(plugin, "version", "unknown")),
+                "description": (getattr(plugin, "description", None) or "").strip(),
+                "dependencies": list(getattr(plugin, "dependencies", [])),
+            }
+        graph = {name: info["dependencies"] for name, info in manifest.items()}
+        bundles = {name: list(entry) for name, entry in self.bundle_modules.items() if name in order}
+        return {"order": order, "manifest": manifest, "dependency_graph": graph, "bundles": bundles}
+
     def unload_all_plugins(self) -> None:
         """Unload all plugins"""
         for plugin in self.plugins.copy():  # Copy to avoid modification during iteration
@@ -91,22 +269,193 @@ class PluginManager:
         logger.info("All plugins unloaded")
 
     def reload_plugin(self, plugin_name: str) -> None:
-        """Reload a specific plugin"""
-        # Find and unload the plugin
+        """Reload a specific plugin together with the plugins that depend on it"""
         plugin = self.get_plugin_by_name(plugin_name)
-        module_name = plugin.__module__
-        self.unload_plugin(plugin)
-        
-        # Reload the module
-        import importlib
-        if module_name in sys.modules:
-            importlib.reload(sys.modules[module_name])
-        
-        # Re-register the plugin
-        module = importlib.import_module(module_name)
-        self._register_plugin(module)
+        self.reload_modules([plugin.__module__], force=True)
         logger.info(f"Reloaded plugin: {plugin_name}")
 
+    # Hot reload support
+    def _source_file(self, module_name: str) -> Optional[str]:
+        """Return the source file backing a loaded module"""
+        module = sys.modules.get(module_name)
+        path = getattr(module, "__file__", None)
+        if path and path.endswith(".py") and os.path.exists(path):
+            return path
+        return None
+
+    @staticmethod
+    def _hash_source(path: str) -> str:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _record_source(self, module_name: str, with_hash: bool = False) -> None:
+        """Remember a module's source stat; the content hash is only taken once changes are watched"""
+        path = self._source_file(module_name)
+        if path is None:
+            return
+        try:
+            stat = os.stat(path)
+            digest = self._hash_source(path) if with_hash else None
+        except OSError as e:
+            logger.warning(f"Could not record plugin source {path}: {e}")
+            return
+        self.module_sources[module_name] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    def check_for_changes(self) -> List[str]:
+        """Return loaded plugin modules whose source content changed on disk"""
+        changed = []
+        for module_name, (mtime_ns, size, digest) in list(self.module_sources.items()):
+            path = self._source_file(module_name)
+            if path is None:
+                continue
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                    if digest is None:
+                        # First check since loading: take the baseline hash now, off the startup path
+                        self.module_sources[module_name] = (mtime_ns, size, self._hash_source(path))
+                    continue
+                if stat.st_size != size or digest is None:
+                    changed.append(module_name)
+                    continue
+                current_digest = self._hash_source(path)
+            except OSError as e:
+                logger.warning(f"Could not check plugin source {path}: {e}")
+                continue
+            if current_digest == digest:
+                # Touched but not modified, no reload needed
+                self.module_sources[module_name] = (stat.st_mtime_ns, stat.st_size, digest)
+            else:
+                changed.append(module_name)
+        return changed
+
+    def _reload_order(self, module_names: List[str]) -> List[str]:
+        """Expand modules with their dependents and sort them in dependency order"""
+        with self._registry_lock:
+            plugins = list(self.plugins)
+        owner = {p.__class__.__name__: p.__module__ for p in plugins}
+        module_deps: Dict[str, set] = {}
+        for p in plugins:
+            names = (Requirement.parse(d).name for d in getattr(p, 'dependencies', []))
+            deps = {owner[n] for n in names if n in owner}
+            module_deps.setdefault(p.__module__, set()).update(deps - {p.__module__})
+
+        # Pull in every module that (transitively) depends on a changed one
+        selected = set(module_names)
+        grew = True
+        while grew:
+            grew = False
+            for module_name, deps in module_deps.items():
+                if module_name not in selected and deps & selected:
+                    selected.add(module_name)
+                    grew = True
+
+        order: List[str] = []
+        visiting = set()
+
+        def visit(module_name: str) -> None:
+            if module_name in order:
+                return
+            if module_name in visiting:
+                raise PluginError(module_name, "Circular plugin dependency")
+            visiting.add(module_name)
+            for dep in sorted(module_deps.get(module_name, ())):
+                if dep in selected:
+                    visit(dep)
+            visiting.discard(module_name)
+            order.append(module_name)
+
+        for module_name in sorted(selected):
+            visit(module_name)
+        return order
+
+    def reload_modules(self, module_names: List[str], force: bool = False) -> List[str]:
+        """Reload plugin modules and their dependents, swapping registry entries atomically"""
+        if not force:
+            changed = set(self.check_for_changes())
+            module_names = [m for m in module_names if m in changed]
+        if not module_names:
+            return []
+
+        order = self._reload_order(module_names)
+        with self._registry_lock:
+            old_plugins = [p for p in self.plugins if p.__module__ in order]
+            # Stage the new registry in a separate list so readers never see a partial set;
+            # plugins still register against this manager and look each other up in the staged list
+            staged = [p for p in self.plugins if p.__module__ not in order]
+            self._staging = (threading.get_ident(), staged)
+            try:
+                for module_name in order:
+                    module = sys.modules.get(module_name)
+                    module = importlib.reload(module) if module else importlib.import_module(module_name)
+                    self._register_plugin(module, target=staged)
+            except Exception as e:
+                logger.error(f"Hot reload of {', '.join(order)} failed, keeping previous plugins: {e}")
+                # Undo the plugins that did register, and remember the broken source so
+                # the watcher does not retry it until the file changes again
+                for plugin in staged:
+                    if not any(plugin is live for live in self.plugins):
+                        self._release_plugin(plugin)
+                for module_name in order:
+                    self._record_source(module_name, with_hash=True)
+                return []
+            finally:
+                self._staging = None
+
+            # Results cached by the old code must not outlive it
+            for plugin in old_plugins:
+                cache_manager.clear_namespace(getattr(plugin, "name", plugin.__class__.__name__), persistent=True)
+            self.plugins[:] = staged  # Single atomic swap
+            for module_name in order:
+                self._record_source(module_name, with_hash=True)
+
+        for plugin in old_plugins:
+            self._release_plugin(plugin)
+        logger.info(f"Hot reloaded modules: {', '.join(order)}")
+        self.event_bus.publish(PLUGIN_RELOADED, {"modules": order})
+        return order
+
+    def _release_plugin(self, plugin: Plugin) -> None:
+        """Run a plugin's cleanup and drop the subscriptions and buffers the framework holds for it"""
+        try:
+            plugin.unregister()
+        except Exception as e:
+            logger.error(f"Error unregistering plugin {plugin}: {e}")
+        self.event_bus.unsubscribe_owner(plugin)
+        shared_store.release_owner(plugin)
+
+    def reload_changed(self) -> List[str]:
+        """Reload only the plugin modules whose source changed since the last load"""
+        changed = self.check_for_changes()
+        if not changed:
+            return []
+        return self.reload_modules(changed, force=True)
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Start polling plugin sources in the background and hot reload on change"""
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+        self._watch_stop.clear()
+        self.check_for_changes()  # Take baseline hashes before the first poll
+
+        def _loop():
+            while not self._watch_stop.wait(interval):
+                try:
+                    self.reload_changed()
+                except Exception as e:
+                    logger.error(f"Plugin watcher error: {e}")
+
+        self._watch_thread = threading.Thread(target=_loop, name="PluginWatcher", daemon=True)
+        self._watch_thread.start()
+        logger.info(f"Watching {len(self.module_sources)} plugin modules for changes")
+
+    def stop_watching(self) -> None:
+        """Stop the background plugin watcher"""
+        self._watch_stop.set()
+        if self._watch_thread:
+            self._watch_thread.join()
+            self._watch_thread = None
+
 # Plugin Discovery Utilities
 class PluginInfo:
     """Information about a discovered plugin"""
@@ -124,7 +473,13 @@ def scan_for_plugins(directory: str) -> List[PluginInfo]:
         return plugins
     
     for file in os.listdir(directory):
-        if file.endswith(".py") and not file.startswith("__"):
+        if file.endswith(".zip"):
+            manifest = read_bundle_manifest(os.path.join(directory, file)) or {}
+            modules = {info["module"]: info for info in manifest.get("plugins", {}).values()}
+            for module_name, info in modules.items():
+                plugins.append(PluginInfo(module_name, os.path.join(directory, file),
+                                          info["version"], info["description"]))
+        elif file.endswith(".py") and not file.startswith("__"):
             file_path = os.path.join(directory, file)
             plugin_name = file[:-3]
             
@@ -150,20 +505,30 @@ def scan_for_plugins(directory: str) -> List[PluginInfo]:
     
     return plugins
 
+def plugin_metadata(plugin_class: type) -> tuple:
+    """Return (version, dependencies) declared on a plugin class or its module"""
+    module = sys.modules.get(plugin_class.__module__)
+    version = getattr(plugin_class, '__version__', None) or getattr(module, '__version__', '1.0.0')
+    dependencies = getattr(plugin_class, '__dependencies__', None)
+    if dependencies is None:
+        dependencies = getattr(module, '__dependencies__', [])
+    return str(version), list(dependencies)
+
 # Enhanced Plugin Base Class
 class EnhancedPlugin(Plugin):
     """Enhanced plugin base class with more features"""
     
     def __init__(self):
         self.name = self.__class__.__name__
-        self.version = getattr(self, '__version__', '1.0.0')
+        self.version, self.dependencies = plugin_metadata(self.__class__)
         self.description = getattr(self, '__doc__', 'No description available')
         self.enabled = True
-        self.dependencies = getattr(self, '__dependencies__', [])
+        self.event_bus = event_bus
     
     def register(self, framework):
         """Register the plugin with the framework"""
         logger.info(f"Registering plugin: {self.name} v{self.version}")
+        self.event_bus = getattr(framework, 'event_bus', self.event_bus)
         # Check dependencies
         self._check_dependencies(framework)
         # Custom registration logic can be overridden
@@ -172,6 +537,7 @@ class EnhancedPlugin(Plugin):
     def unregister(self):
         """Unregister the plugin"""
         logger.info(f"Unregistering plugin: {self.name}")
+        scheduler.cancel_owner(self)
         self.on_unregister()
     
     def on_register(self, framework):
@@ -184,10 +550,38 @@ class EnhancedPlugin(Plugin):
     
     def _check_dependencies(self, framework):
         """Check if plugin dependencies are met"""
+        if getattr(framework, "dependencies_validated", False):
+            return
         for dep in self.dependencies:
-            if dep not in framework.list_plugins():
+            requirement = Requirement.parse(dep)
+            try:
+                provider = framework.get_plugin_by_name(requirement.name)
+            except PluginError:
                 raise PluginError(self.name, f"Missing dependency: {dep}")
+            version = getattr(provider, 'version', '0')
+            if not requirement.matches(version):
+                raise PluginError(self.name, f"Dependency {dep} not satisfied by installed version {version}")
     
+    def subscribe(self, topic: str, callback, **options):
+        """Subscribe to an event bus topic; the subscription is dropped when the plugin is unloaded"""
+        return self.event_bus.subscribe(topic, callback, owner=self, **options)
+
+    def publish(self, topic: str, payload=None):
+        """Publish an event on the framework event bus"""
+        return self.event_bus.publish(topic, payload)
+
+    def schedule_every(self, seconds: float, func, *args, **kwargs):
+        """Run func periodically; the job is cancelled when the plugin unregisters"""
+        return scheduler.every(seconds, func, *args, owner=self, **kwargs)
+
+    def schedule_after(self, seconds: float, func, *args, **kwargs):
+        """Run func once after a delay; the job is cancelled when the plugin unregisters"""
+        return scheduler.after(seconds, func, *args, owner=self, **kwargs)
+
+    def schedule_cron(self, expression: str, func, *args, **kwargs):
+        """Run func on a cron schedule; the job is cancelled when the plugin unregisters"""
+        return scheduler.cron(expression, func, *args, owner=self, **kwargs)
+
     def enable(self):
         """Enable the plugin"""
         self.enabled = True
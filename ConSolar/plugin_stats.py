@@ -0,0 +1,186 @@
+import functools
+import inspect
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from rich.table import Table
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("PluginStats")
+
+class CallStats:
+    """Accumulated cost of one plugin method or lifecycle hook"""
+
+    __slots__ = ("calls", "wall", "cpu", "max_wall", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, wall: float, cpu: float) -> None:
+        # Instrumented methods may be called from several threads at once
+        with self._lock:
+            self.calls += 1
+            self.wall += wall
+            self.cpu += cpu
+            if wall > self.max_wall:
+                self.max_wall = wall
+
+class PluginUsage:
+    """Everything recorded for one plugin"""
+
+    def __init__(self, name: str, module: str = ""):
+        self.name = name
+        self.module = module
+        self.methods: Dict[str, CallStats] = {}
+        self.memory: Dict[str, int] = {}  # phase -> bytes allocated
+
+    def stats_for(self, method: str) -> CallStats:
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods.setdefault(method, CallStats())
+        return stats
+
+    def totals(self) -> Dict[str, float]:
+        return {
+            "calls": sum(s.calls for s in self.methods.values()),
+            "wall": sum(s.wall for s in self.methods.values()),
+            "cpu": sum(s.cpu for s in self.methods.values()),
+            "memory": sum(self.memory.values()),
+        }
+
+class PluginAccounting:
+    """Opt-in attribution of time, memory and call counts to plugins"""
+
+    LIFECYCLE = ("import", "register", "unregister")
+
+    def __init__(self):
+        self.enabled = os.getenv("CONSOLAR_PLUGIN_STATS", "").lower() in ("1", "true", "yes", "on")
+        self.track_memory = False
+        self.usage: Dict[str, PluginUsage] = {}
+        self.module_usage: Dict[str, PluginUsage] = {}  # Import cost is known before the plugin classes
+        self._lock = threading.Lock()
+
+    def enable(self, track_memory: bool = False) -> None:
+        """Turn accounting on; memory tracking starts tracemalloc, which slows allocation-heavy code"""
+        self.enabled = True
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        logger.info(f"Plugin accounting enabled (memory tracking: {track_memory})")
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_memory = False
+
+    def _usage(self, name: str, module: str = "") -> PluginUsage:
+        usage = self.usage.get(name)
+        if usage is None:
+            with self._lock:
+                usage = self.usage.setdefault(name, PluginUsage(name, module))
+        if module and not usage.module:
+            usage.module = module
+        return usage
+
+    @contextmanager
+    def measure(self, name: str, phase: str, module: str = "", scope_file: Optional[str] = None):
+        """Time a lifecycle phase of a plugin (or a module, for 'import') and record its allocations"""
+        if not self.enabled:
+            yield
+            return
+        usage = self.module_usage.setdefault(name, PluginUsage(name, name)) if phase == "import" \
+            else self._usage(name, module)
+        snapshot = tracemalloc.take_snapshot() if self.track_memory else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            usage.stats_for(phase).add(time.perf_counter() - wall, time.process_time() - cpu)
+            if snapshot is not None:
+                usage.memory[phase] = self._allocated_since(snapshot, scope_file)
+
+    @staticmethod
+    def _allocated_since(snapshot, scope_file: Optional[str]) -> int:
+        diff = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        if scope_file:
+            # Scope the attribution to allocations made by the plugin's own module
+            diff = [stat for stat in diff if stat.traceback[0].filename == scope_file]
+        return max(0, sum(stat.size_diff for stat in diff))
+
+    def instrument(self, plugin: Any) -> None:
+        """Wrap the plugin's public methods so each call is timed and counted"""
+        if not self.enabled:
+            return
+        usage = self._usage(plugin.__class__.__name__, plugin.__module__)
+        for attr_name in dir(plugin.__class__):
+            if attr_name.startswith("_") or attr_name in ("register", "unregister"):
+                continue
+            # Look the attribute up without running it: a property getter must not execute
+            # (and fail, or be slow) just because accounting is on
+            raw = inspect.getattr_static(plugin, attr_name, None)
+            if inspect.isdatadescriptor(raw) or isinstance(raw, functools.cached_property):
+                continue
+            method = getattr(plugin, attr_name, None)
+            if not callable(method) or isinstance(method, type):
+                continue
+            setattr(plugin, attr_name, self._wrap(method, usage.stats_for(attr_name)))
+
+    @staticmethod
+    def _wrap(method, stats: CallStats):
+        perf_counter, process_time = time.perf_counter, time.process_time
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            wall, cpu = perf_counter(), process_time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats.add(perf_counter() - wall, process_time() - cpu)
+        return wrapper
+
+    def report(self, sort_by: str = "wall", limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-plugin totals, most expensive first; sort_by is wall, cpu, calls or memory"""
+        rows = []
+        for name, usage in list(self.usage.items()):
+            totals = usage.totals()
+            module_usage = self.module_usage.get(usage.module)
+            if module_usage is not None:
+                # Import cost belongs to the module; every plugin it defines shows it
+                imported = module_usage.totals()
+                totals["wall"] += imported["wall"]
+                totals["cpu"] += imported["cpu"]
+                totals["memory"] += imported["memory"]
+            top = max(usage.methods.items(), key=lambda item: item[1].wall, default=(None, None))[0]
+            rows.append(dict(totals, name=name, module=usage.module, hottest=top or ""))
+        rows.sort(key=lambda row: row.get(sort_by, 0), reverse=True)
+        return rows[:limit] if limit else rows
+
+    def render_report(self, sort_by: str = "wall", limit: Optional[int] = 20) -> Table:
+        """Top plugins as a Rich table"""
+        table = Table(title=f"Top plugins by {sort_by}")
+        table.add_column("Plugin")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall (ms)", justify="right")
+        table.add_column("CPU (ms)", justify="right")
+        table.add_column("Memory (KiB)", justify="right")
+        table.add_column("Hottest method")
+        for row in self.report(sort_by, limit):
+            table.add_row(row["name"], str(row["calls"]), f"{row['wall'] * 1000:.2f}",
+                          f"{row['cpu'] * 1000:.2f}", f"{row['memory'] / 1024:.1f}", row["hottest"])
+        return table
+
+    def reset(self) -> None:
+        with self._lock:
+            self.usage.clear()
+            self.module_usage.clear()
+
+# Global accounting instance
+plugin_accounting = PluginAccounting()
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional
+from rich.console import Console
+from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, MofNCompleteColumn
+
+class ProgressTask:
+    """A unit of tracked work; advancing it only bumps a counter until a redraw is due"""
+
+    __slots__ = ("reporter", "description", "total", "completed", "depth", "task_id")
+
+    def __init__(self, reporter: "ProgressReporter", description: str,
+                 total: Optional[float], depth: int):
+        self.reporter = reporter
+        self.description = description
+        self.total = total
+        self.completed = 0
+        self.depth = depth
+        self.task_id = None  # Rich task id, only set when rendering
+
+    def advance(self, amount: float = 1) -> None:
+        """Record progress; the terminal is redrawn at most once per refresh interval"""
+        self.completed += amount
+        if self.task_id is not None:
+            self.reporter._maybe_refresh()
+
+    def update(self, completed: Optional[float] = None, total: Optional[float] = None,
+               description: Optional[str] = None) -> None:
+        """Set absolute progress values"""
+        if completed is not None:
+            self.completed = completed
+        if total is not None:
+            self.total = total
+        if description is not None:
+            self.description = description
+        if self.task_id is not None:
+            self.reporter._maybe_refresh()
+
+    def close(self) -> None:
+        """Finish the task and remove it from the display"""
+        self.reporter._close(self)
+
+    def __enter__(self) -> "ProgressTask":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class ProgressReporter:
+    """Framework-wide progress reporting with batched, time-throttled redraws"""
+
+    def __init__(self, refresh_interval: float = 0.1, enabled: Optional[bool] = None,
+                 console: Optional[Console] = None):
+        self.refresh_interval = refresh_interval
+        self.console = console or Console(stderr=True)
+        if enabled is None:
+            enabled = os.getenv("CONSOLAR_HEADLESS", "").lower() not in ("1", "true", "yes", "on")
+        self.enabled = enabled
+        self.tasks: List[ProgressTask] = []
+        self._progress: Optional[Progress] = None
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def rendering(self) -> bool:
+        """Whether progress is drawn; headless and non-TTY runs only keep counters"""
+        return self.enabled and self.console.is_terminal
+
+    def _stack(self) -> List[ProgressTask]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def task(self, description: str, total: Optional[float] = None) -> ProgressTask:
+        """Start a task; tasks opened while another is active on this thread are nested under it"""
+        stack = self._stack()
+        task = ProgressTask(self, description, total, len(stack))
+        stack.append(task)
+        with self._lock:
+            self.tasks.append(task)
+            if self.rendering:
+                if self._progress is None:
+                    self._progress = Progress(
+                        TextColumn("{task.description}"),
+                        BarColumn(),
+                        MofNCompleteColumn(),
+                        TimeRemainingColumn(),
+                        console=self.console,
+                        auto_refresh=False,
+                        transient=True,
+                    )
+                    self._progress.start()
+                task.task_id = self._progress.add_task(self._label(task), total=total)
+        return task
+
+    def track(self, iterable: Iterable, description: str, total: Optional[float] = None) -> Iterator:
+        """Iterate while reporting one step per item"""
+        if total is None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        with self.task(description, total) as task:
+            for item in iterable:
+                yield item
+                task.advance()
+
+    @staticmethod
+    def _label(task: ProgressTask) -> str:
+        return "  " * task.depth + task.description
+
+    def _maybe_refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.refresh_interval:
+            return
+        with self._lock:
+            if self._progress is None:
+                return
+            self._last_refresh = now
+            for task in self.tasks:
+                if task.task_id is not None:
+                    self._progress.update(task.task_id, completed=task.completed,
+                                          total=task.total, description=self._label(task))
+            self._progress.refresh()
+
+    def _close(self, task: ProgressTask) -> None:
+        stack = self._stack()
+        if task in stack:
+            stack.remove(task)
+        with self._lock:
+            if task not in self.tasks:
+                return
+            self.tasks.remove(task)
+            if task.task_id is not None and self._progress is not None:
+                self._progress.remove_task(task.task_id)
+                task.task_id = None
+                if any(t.task_id is not None for t in self.tasks):
+                    self._maybe_refresh(force=True)
+                else:
+                    self._progress.stop()
+                    self._progress = None
+
+# Global progress reporter
+progress = ProgressReporter()
@@ -0,0 +1,282 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+from error_handler import ConSolarError, CronExpressionError
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("Scheduler")
+
+# Longest the timer sleeps without checking whether the wall clock was changed,
+# which moves the monotonic deadlines of cron jobs
+_CLOCK_CHECK_INTERVAL = 60.0
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week"""
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise CronExpressionError(expression, "needs 5 fields")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self.RANGES)
+        )
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def _parse(self, field: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = self._number(field, step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (self._number(field, x) for x in part.split("-", 1))
+            else:
+                start = end = self._number(field, part)
+                if step > 1:
+                    end = high
+            # Day of week accepts 7 for Sunday
+            if start < low or end > (7 if high == 6 else high) or start > end or step < 1:
+                raise CronExpressionError(self.expression, f"invalid field '{field}'")
+            values.update(v % 7 if high == 6 else v for v in range(start, end + 1, step))
+        return values
+
+    def _number(self, field: str, text: str) -> int:
+        try:
+            return int(text)
+        except ValueError:
+            raise CronExpressionError(self.expression, f"invalid field '{field}'") from None
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok  # Classic cron: either restriction may match
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after the given time"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = (candidate.year + 1, 1) if candidate.month == 12 else (candidate.year, candidate.month + 1)
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise CronExpressionError(self.expression, "never fires")
+
+class Job:
+    """A scheduled callable"""
+
+    def __init__(self, scheduler: "Scheduler", func: Callable, args: tuple, kwargs: dict,
+                 interval: Optional[float] = None, cron: Optional[CronSchedule] = None,
+                 owner: Any = None, max_instances: int = 1, name: Optional[str] = None):
+        self.scheduler = scheduler
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.cron = cron
+        self.owner = owner
+        self.max_instances = max_instances
+        self.name = name or getattr(func, "__qualname__", repr(func))
+        self.next_run = 0.0   # Wall-clock time of the next run, for display and cron
+        self.deadline = 0.0   # time.monotonic() value the timer waits for
+        self.running = 0
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+        self.cancelled = False
+
+    @property
+    def repeating(self) -> bool:
+        return self.interval is not None or self.cron is not None
+
+    def schedule_in(self, delay: float) -> None:
+        """Run after `delay` seconds on the monotonic clock, unaffected by wall-clock changes"""
+        self.deadline = time.monotonic() + delay
+        self.next_run = time.time() + delay
+
+    def schedule_at(self, timestamp: float) -> None:
+        """Run at a wall-clock time; the deadline is re-derived if the clock is changed"""
+        self.next_run = timestamp
+        self.deadline = time.monotonic() + (timestamp - time.time())
+
+    def schedule_next(self) -> None:
+        if self.cron is not None:
+            self.schedule_at(self.cron.next_after(datetime.now()).timestamp())
+        else:
+            self.schedule_in(self.interval)
+
+    def cancel(self) -> None:
+        """Stop the job from running again"""
+        self.scheduler.cancel(self)
+
+    def __repr__(self) -> str:
+        return f"Job({self.name!r}, next_run={self.next_run:.3f})"
+
+class Scheduler:
+    """Central timer for delayed, periodic and cron jobs, driven by a single thread and a heap"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.jobs: Set[Job] = set()
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+        self._clock_offset = time.time() - time.monotonic()
+
+    def _add(self, job: Job) -> Job:
+        with self._condition:
+            self.jobs.add(job)
+            heapq.heappush(self._heap, (job.deadline, next(self._counter), job))
+            self._ensure_started()
+            self._condition.notify()
+        return job
+
+    def every(self, seconds: float, func: Callable, *args, owner: Any = None, max_instances: int = 1,
+              start_immediately: bool = False, name: Optional[str] = None, **kwargs) -> Job:
+        """Run func every `seconds`"""
+        if seconds <= 0:
+            raise ConSolarError("Interval must be positive")
+        job = Job(self, func, args, kwargs, interval=seconds, owner=owner, max_instances=max_instances, name=name)
+        job.schedule_in(0 if start_immediately else seconds)
+        return self._add(job)
+
+    def after(self, seconds: float, func: Callable, *args, owner: Any = None,
+              name: Optional[str] = None, **kwargs) -> Job:
+        """Run func once after `seconds`"""
+        job = Job(self, func, args, kwargs, owner=owner, name=name)
+        job.schedule_in(max(0.0, seconds))
+        return self._add(job)
+
+    def cron(self, expression: str, func: Callable, *args, owner: Any = None, max_instances: int = 1,
+             name: Optional[str] = None, **kwargs) -> Job:
+        """Run func on a cron schedule, e.g. '*/5 * * * *'"""
+        schedule = CronSchedule(expression)
+        job = Job(self, func, args, kwargs, cron=schedule, owner=owner, max_instances=max_instances, name=name)
+        job.schedule_next()
+        return self._add(job)
+
+    def cancel(self, job: Job) -> None:
+        """Cancel a job; heap entries of cancelled jobs are skipped lazily"""
+        with self._condition:
+            job.cancelled = True
+            self.jobs.discard(job)
+
+    def cancel_owner(self, owner: Any) -> int:
+        """Cancel every job registered by an owner (e.g. an unregistering plugin)"""
+        with self._condition:
+            jobs = [job for job in self.jobs if job.owner is owner]
+            for job in jobs:
+                job.cancelled = True
+                self.jobs.discard(job)
+        if jobs:
+            logger.debug(f"Cancelled {len(jobs)} jobs of {getattr(owner, 'name', owner)}")
+        return len(jobs)
+
+    def _ensure_started(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="SchedulerJob")
+        self._thread = threading.Thread(target=self._loop, name="Scheduler", daemon=True)
+        self._thread.start()
+
+    def _check_clock(self) -> None:
+        """Re-derive cron deadlines after the wall clock was set (NTP step, manual change); call locked"""
+        offset = time.time() - time.monotonic()
+        if abs(offset - self._clock_offset) < 1.0:
+            return
+        logger.debug(f"Wall clock moved by {offset - self._clock_offset:+.1f}s, rescheduling cron jobs")
+        self._clock_offset = offset
+        for _, _, job in self._heap:
+            if job.cron is not None:
+                job.schedule_at(job.next_run)
+        self._heap = [(job.deadline, count, job) for _, count, job in self._heap]
+        heapq.heapify(self._heap)
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._running:
+                    self._check_clock()
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    timeout = min(self._heap[0][0] - now, _CLOCK_CHECK_INTERVAL) if self._heap else None
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.cancelled:
+                    continue
+                if job.repeating:
+                    job.schedule_next()
+                    heapq.heappush(self._heap, (job.deadline, next(self._counter), job))
+                else:
+                    self.jobs.discard(job)
+                if job.running >= job.max_instances:
+                    job.skipped += 1
+                    continue
+                job.running += 1
+            self._executor.submit(self._execute, job)
+
+    def _execute(self, job: Job) -> None:
+        try:
+            job.func(*job.args, **job.kwargs)
+        except Exception as e:
+            job.failures += 1
+            logger.error(f"Scheduled job '{job.name}' failed: {e}")
+        finally:
+            with self._condition:
+                job.running -= 1
+                job.runs += 1
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Describe scheduled jobs"""
+        with self._condition:
+            jobs = sorted(self.jobs, key=lambda j: j.next_run)
+        return [{
+            "name": job.name,
+            "owner": getattr(job.owner, "name", job.owner),
+            "next_run": job.next_run,
+            "runs": job.runs,
+            "skipped": job.skipped,
+            "failures": job.failures,
+        } for job in jobs]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the timer thread and worker pool"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+# Global scheduler instance
+scheduler = Scheduler()
@@ -0,0 +1,173 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+from error_handler import ValidationError, SchemaValidationError
+
+# A compiled validator takes (value, path, errors) and returns the coerced value.
+# Violations are appended to `errors` so a whole tree is checked in one pass.
+Validator = Callable[[Any, str, List[ValidationError]], Any]
+
+_TRUE = {"true", "1", "yes", "on", "y"}
+_FALSE = {"false", "0", "no", "off", "n"}
+
+def _coerce_int(value):
+    if isinstance(value, bool):
+        raise ValueError("booleans are not integers")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError("not a whole number")
+    return int(value.strip()) if isinstance(value, str) else int(value)
+
+def _coerce_float(value):
+    if isinstance(value, bool):
+        raise ValueError("booleans are not numbers")
+    return float(value.strip()) if isinstance(value, str) else float(value)
+
+def _coerce_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _TRUE | _FALSE:
+        return value.strip().lower() in _TRUE
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError("not a boolean")
+
+def _coerce_str(value):
+    if isinstance(value, (dict, list)):
+        raise ValueError("not a string")
+    return str(value)
+
+_TYPES = {
+    "int": (int, _coerce_int),
+    "float": (float, _coerce_float),
+    "number": ((int, float), _coerce_float),
+    "bool": (bool, _coerce_bool),
+    "str": (str, _coerce_str),
+    "list": (list, None),
+    "dict": (dict, None),
+    "any": (object, None),
+}
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+def compile_schema(spec: Dict[str, Any]) -> Validator:
+    """Compile a declarative schema into a validator closure.
+
+    Supported keys: type, coerce, required, nullable, default, min, max,
+    min_length, max_length, choices, pattern, items (list element schema),
+    fields (dict field schemas), allow_extra, check (callable returning an
+    error message or None).
+    """
+    type_name = spec.get("type", "any")
+    if type_name not in _TYPES:
+        raise ValueError(f"Unknown schema type '{type_name}'")
+    expected, coercer = _TYPES[type_name]
+    coerce = spec.get("coerce", True) and coercer is not None
+    nullable = spec.get("nullable", False)
+    checks: List[Callable[[Any], Optional[str]]] = []
+
+    if "min" in spec:
+        low = spec["min"]
+        checks.append(lambda v: None if v >= low else f"Must be >= {low}")
+    if "max" in spec:
+        high = spec["max"]
+        checks.append(lambda v: None if v <= high else f"Must be <= {high}")
+    if "min_length" in spec:
+        min_length = spec["min_length"]
+        checks.append(lambda v: None if len(v) >= min_length else f"Length must be >= {min_length}")
+    if "max_length" in spec:
+        max_length = spec["max_length"]
+        checks.append(lambda v: None if len(v) <= max_length else f"Length must be <= {max_length}")
+    if "choices" in spec:
+        choices = frozenset(spec["choices"])
+        listed = ", ".join(map(str, spec["choices"]))
+        checks.append(lambda v: None if v in choices else f"Must be one of: {listed}")
+    if "pattern" in spec:
+        pattern = re.compile(spec["pattern"])
+        checks.append(lambda v: None if pattern.fullmatch(v) else f"Must match {pattern.pattern}")
+    if "check" in spec:
+        checks.append(spec["check"])
+
+    item_validator = compile_schema(spec["items"]) if "items" in spec else None
+    field_validators = {name: (compile_schema(field), field) for name, field in spec.get("fields", {}).items()}
+    allow_extra = spec.get("allow_extra", True)
+
+    def validate(value: Any, path: str, errors: List[ValidationError]) -> Any:
+        if value is None and nullable:
+            return None
+        if not isinstance(value, expected) or (type_name in ("int", "float", "number") and isinstance(value, bool)):
+            if not coerce:
+                errors.append(ValidationError(path or "value", value, f"Expected {type_name}"))
+                return value
+            try:
+                value = coercer(value)
+            except (TypeError, ValueError):
+                errors.append(ValidationError(path or "value", value, f"Expected {type_name}"))
+                return value
+        for check in checks:
+            message = check(value)
+            if message:
+                errors.append(ValidationError(path or "value", value, message))
+                return value
+        if item_validator is not None:
+            value = [item_validator(item, f"{path}[{index}]", errors) for index, item in enumerate(value)]
+        if field_validators:
+            result = dict(value) if allow_extra else {}
+            for name, (field_validator, field_spec) in field_validators.items():
+                if name in value:
+                    result[name] = field_validator(value[name], _join(path, name), errors)
+                elif "default" in field_spec:
+                    result[name] = field_spec["default"]
+                elif field_spec.get("required", False):
+                    errors.append(ValidationError(_join(path, name), None, "Required field is missing"))
+            if not allow_extra:
+                for name in value:
+                    if name not in field_validators:
+                        errors.append(ValidationError(_join(path, name), value[name], "Unknown field"))
+            value = result
+        return value
+
+    return validate
+
+class Schema:
+    """A compiled schema; validate() coerces a value or raises one batch of every violation"""
+
+    def __init__(self, spec: Dict[str, Any], name: str = "value"):
+        self.spec = spec
+        self.name = name
+        self._validator = compile_schema(spec)
+        self._subschemas: Dict[str, Optional["Schema"]] = {}
+
+    def validate(self, value: Any, path: str = "") -> Any:
+        errors: List[ValidationError] = []
+        result = self._validator(value, path, errors)
+        if errors:
+            raise SchemaValidationError(self.name, errors)
+        return result
+
+    def apply(self, value: Any, path: str, errors: List[ValidationError]) -> Any:
+        """Coerce a value, appending violations to an existing error list"""
+        return self._validator(value, path, errors)
+
+    def errors(self, value: Any, path: str = "") -> List[ValidationError]:
+        errors: List[ValidationError] = []
+        self._validator(value, path, errors)
+        return errors
+
+    def __call__(self, value: Any) -> Any:
+        return self.validate(value)
+
+    def subschema(self, key_path: str, separator: str = ".") -> Optional["Schema"]:
+        """Schema of a nested field, or None if the path is not described"""
+        cache_key = f"{separator}{key_path}"
+        if cache_key in self._subschemas:
+            return self._subschemas[cache_key]
+        spec = self.spec
+        for key in key_path.split(separator):
+            fields = spec.get("fields")
+            if not fields or key not in fields:
+                spec = None
+                break
+            spec = fields[key]
+        schema = Schema(spec, key_path) if spec is not None else None
+        self._subschemas[cache_key] = schema
+        return schema
@@ -0,0 +1,206 @@
+import mmap
+import os
+import sys
+import tempfile
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+from error_handler import ConSolarError
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("SharedStore")
+
+class SharedBuffer:
+    """A named block of shared memory with reference-counted holders"""
+
+    def __init__(self, name: str, size: int, owner: Any, backend: str, directory: str):
+        self.name = name
+        self.size = size
+        self.owner = owner
+        self.backend = backend
+        self.holders: Dict[int, int] = {}  # id(holder) -> reference count
+        self.published = True
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self.path: Optional[str] = None
+
+        if backend == "shm":
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self.view = self._shm.buf[:size]
+        elif backend == "mmap":
+            fd, self.path = tempfile.mkstemp(prefix="consolar-", suffix=".buf", dir=directory)
+            try:
+                os.ftruncate(fd, max(size, 1))
+                self._mmap = mmap.mmap(fd, max(size, 1))
+            finally:
+                os.close(fd)
+            self.view = memoryview(self._mmap)[:size]
+        else:
+            raise ConSolarError(f"Unknown shared buffer backend '{backend}'")
+
+    @property
+    def refcount(self) -> int:
+        return sum(self.holders.values())
+
+    def handle(self) -> Tuple[str, str, int]:
+        """Picklable descriptor that worker processes pass to attach()"""
+        location = self._shm.name if self._shm is not None else self.path
+        return (self.backend, location, self.size)
+
+    def free(self) -> None:
+        self.view.release()
+        try:
+            if self._shm is not None:
+                self._shm.close()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            logger.warning(f"Shared buffer '{self.name}' still has exported views, memory freed at exit")
+        # Unlink even if close failed: the name/file goes away now and the pages
+        # are released once the last mapping is dropped
+        try:
+            if self._shm is not None:
+                self._shm.unlink()
+            if self._mmap is not None:
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+class SharedStore:
+    """Framework-managed store of named shared buffers exchanged between plugins without copying"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self.buffers: Dict[str, SharedBuffer] = {}
+        self._lock = threading.RLock()
+
+    def publish(self, name: str, data: Any = None, size: Optional[int] = None,
+                owner: Any = None, backend: str = "shm") -> memoryview:
+        """Create a named buffer, optionally filled from a bytes-like object, and return a writable view"""
+        source = memoryview(data).cast("B") if data is not None else None
+        if size is None:
+            if source is None:
+                raise ConSolarError("Either data or size is required to publish a shared buffer")
+            size = source.nbytes
+        with self._lock:
+            if name in self.buffers and self.buffers[name].published:
+                raise ConSolarError(f"Shared buffer '{name}' already exists")
+            buffer = SharedBuffer(name, size, owner, backend, self.directory)
+            if source is not None:
+                buffer.view[:source.nbytes] = source
+            buffer.holders[id(owner)] = 1
+            self.buffers[name] = buffer
+        logger.debug(f"Published shared buffer '{name}' ({size} bytes, {backend})")
+        return buffer.view
+
+    def acquire(self, name: str, holder: Any = None, writable: bool = False) -> memoryview:
+        """Take a reference to a buffer and get a view of it (read-only unless requested)"""
+        with self._lock:
+            buffer = self.buffers.get(name)
+            if buffer is None or not buffer.published:
+                raise ConSolarError(f"Shared buffer '{name}' not found")
+            buffer.holders[id(holder)] = buffer.holders.get(id(holder), 0) + 1
+            return buffer.view if writable else buffer.view.toreadonly()
+
+    def release(self, name: str, holder: Any = None) -> None:
+        """Drop one reference; the memory is freed once nobody holds the buffer"""
+        with self._lock:
+            buffer = self.buffers.get(name)
+            if buffer is None or id(holder) not in buffer.holders:
+                return
+            buffer.holders[id(holder)] -= 1
+            if buffer.holders[id(holder)] <= 0:
+                del buffer.holders[id(holder)]
+            self._collect(buffer)
+
+    def unpublish(self, name: str) -> None:
+        """Stop offering a buffer to new consumers and drop the owner's reference"""
+        with self._lock:
+            buffer = self.buffers.get(name)
+            if buffer is None:
+                return
+            buffer.published = False
+            buffer.holders.pop(id(buffer.owner), None)
+            self._collect(buffer)
+
+    def release_owner(self, holder: Any) -> int:
+        """Release every reference held by a plugin and unpublish the buffers it owns"""
+        released = 0
+        with self._lock:
+            for buffer in list(self.buffers.values()):
+                if buffer.owner is holder:
+                    buffer.published = False
+                if buffer.holders.pop(id(holder), None):
+                    released += 1
+                self._collect(buffer)
+        return released
+
+    def _collect(self, buffer: SharedBuffer) -> None:
+        if buffer.refcount > 0:
+            return
+        if self.buffers.get(buffer.name) is buffer:
+            del self.buffers[buffer.name]
+        buffer.free()
+        logger.debug(f"Freed shared buffer '{buffer.name}'")
+
+    def handle(self, name: str) -> Tuple[str, str, int]:
+        """Descriptor of a buffer that can be sent to a worker process"""
+        with self._lock:
+            buffer = self.buffers.get(name)
+            if buffer is None:
+                raise ConSolarError(f"Shared buffer '{name}' not found")
+            return buffer.handle()
+
+    def list_buffers(self) -> Dict[str, Dict[str, Any]]:
+        """Names, sizes and reference counts of live buffers"""
+        with self._lock:
+            return {
+                name: {"size": b.size, "backend": b.backend, "refcount": b.refcount, "published": b.published}
+                for name, b in self.buffers.items()
+            }
+
+    def close(self) -> None:
+        """Free every buffer regardless of references"""
+        with self._lock:
+            for buffer in list(self.buffers.values()):
+                buffer.holders.clear()
+                self._collect(buffer)
+
+class AttachedBuffer:
+    """A buffer opened in another process from a handle; keep it alive while using the view"""
+
+    def __init__(self, handle: Tuple[str, str, int]):
+        backend, location, size = handle
+        self._shm = None
+        self._mmap = None
+        if backend == "shm":
+            if sys.version_info >= (3, 13):
+                # Only the creating process should unlink the segment
+                self._shm = shared_memory.SharedMemory(name=location, track=False)
+            else:
+                self._shm = shared_memory.SharedMemory(name=location)
+            self.view = self._shm.buf[:size]
+        else:
+            with open(location, "r+b") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0)
+            self.view = memoryview(self._mmap)[:size]
+
+    def close(self) -> None:
+        self.view.release()
+        if self._shm is not None:
+            self._shm.close()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> memoryview:
+        return self.view
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+def attach(handle: Tuple[str, str, int]) -> AttachedBuffer:
+    """Open a shared buffer from its handle, e.g. inside a process pool worker"""
+    return AttachedBuffer(handle)
+
+# Global shared store instance
+shared_store = SharedStore()
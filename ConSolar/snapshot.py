@@ -0,0 +1,106 @@
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Optional
+from logger import ConSolarLogger
+
+logger = ConSolarLogger("Snapshot")
+
+class StartupSnapshot:
+    """Persisted warm-start state, keyed by a fingerprint of the files it was built from"""
+
+    def __init__(self, snapshot_path: str = os.path.join("cache", "startup_snapshot.json")):
+        self.snapshot_path = snapshot_path
+        self.data: Dict[str, Any] = {}
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def _write(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write startup snapshot: {e}")
+
+    @staticmethod
+    def fingerprint(paths: Iterable[str], extra: Any = None) -> str:
+        """Fingerprint files and directory entries by name, size and mtime_ns"""
+        hasher = hashlib.sha256()
+        for path in paths:
+            entries = []
+            if os.path.isdir(path):
+                for name in sorted(os.listdir(path)):
+                    if name == "__pycache__":
+                        continue
+                    entries.append(os.path.join(path, name))
+            else:
+                entries.append(path)
+            for entry in entries:
+                try:
+                    stat = os.stat(entry)
+                    hasher.update(f"{entry}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+                except OSError:
+                    hasher.update(f"{entry}\0missing\n".encode())
+        if extra is not None:
+            hasher.update(json.dumps(extra, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    def load(self, section: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return a section's payload if it was saved with the same fingerprint.
+
+        The payload is shared with the snapshot; callers copy what they keep.
+        """
+        self._ensure_loaded()
+        entry = self.data.get(section)
+        if entry and entry.get("fingerprint") == fingerprint:
+            return entry.get("payload")
+        return None
+
+    def save(self, section: str, fingerprint: str, payload: Dict[str, Any]) -> None:
+        """Persist a section's payload under its fingerprint"""
+        self._ensure_loaded()
+        current = self.data.get(section, {})
+        if current.get("fingerprint") == fingerprint and current.get("payload") == payload:
+            return  # Unchanged since the last start; no rewrite
+        timings = current.get("timings", {})
+        self.data[section] = {
+            "fingerprint": fingerprint,
+            "payload": copy.deepcopy(payload),
+            "timings": timings,
+        }
+        self._write()
+
+    def invalidate(self, section: str) -> None:
+        """Drop a section so the next start takes the cold path"""
+        self._ensure_loaded()
+        if self.data.pop(section, None) is not None:
+            self._write()
+
+    def record_timing(self, section: str, path: str, seconds: float) -> None:
+        """Record the duration of a warm or cold startup step (persisted with the next save)"""
+        self._ensure_loaded()
+        entry = self.data.setdefault(section, {})
+        entry.setdefault("timings", {})[path] = {"seconds": round(seconds, 6), "at": time.time()}
+        logger.info(f"Startup '{section}' took {seconds * 1000:.1f} ms ({path} path)")
+
+    def get_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Get the last recorded warm and cold timings for each section"""
+        self._ensure_loaded()
+        return {section: entry.get("timings", {}) for section, entry in self.data.items()}
+
+# Global snapshot instance
+startup_snapshot = StartupSnapshot()
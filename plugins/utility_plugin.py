@@ -8,9 +8,71 @@ __dependencies__ = []
 
 from ConSolar.plugin_manger import EnhancedPlugin
 from ConSolar.logger import ConSolarLogger
+from ConSolar.progress import progress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 import hashlib
+import json
+import mmap
+import os
+import threading
 import time
 
+# Files at or above this size are hashed through mmap instead of chunked reads
+MMAP_THRESHOLD = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+class HashCache:
+    """Persistent digest cache keyed by (path, size, mtime_ns, algorithm)"""
+
+    def __init__(self, cache_path: str = os.path.join("cache", "hash_cache.json")):
+        self.cache_path = cache_path
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """Load cached digests from disk"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self) -> None:
+        """Write cached digests to disk if anything changed, dropping files that no longer exist"""
+        with self._lock:
+            if not self.dirty:
+                return
+            self.entries = {
+                key: entry for key, entry in self.entries.items()
+                if os.path.exists(key.split(":", 1)[1])
+            }
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+
+    @staticmethod
+    def _key(path: str, algorithm: str) -> str:
+        return f"{algorithm}:{os.path.abspath(path)}"
+
+    def get(self, path: str, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        """Return the cached digest if the file is unchanged"""
+        entry = self.entries.get(self._key(path, algorithm))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def put(self, path: str, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        """Store a digest for the given file state"""
+        with self._lock:
+            self.entries[self._key(path, algorithm)] = [stat.st_size, stat.st_mtime_ns, digest]
+            self.dirty = True
+
 class UtilityPlugin(EnhancedPlugin):
     """
     A utility plugin that provides common utility functions.
@@ -20,6 +82,7 @@ class UtilityPlugin(EnhancedPlugin):
         super().__init__()
         self.logger = ConSolarLogger(f"Plugin-{self.name}")
         self.start_time = time.time()
+        self.hash_cache = HashCache()
     
     def on_register(self, framework):
         """Called when plugin is registered"""
@@ -27,17 +90,100 @@ class UtilityPlugin(EnhancedPlugin):
         
     def on_unregister(self):
         """Called when plugin is unregistered"""
+        self.hash_cache.save()
         uptime = time.time() - self.start_time
         self.logger.info(f"Utility plugin ran for {uptime:.2f} seconds")
     
+    def _new_hash(self, algorithm: str):
+        """Create a hashlib object, rejecting unknown algorithms"""
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError("Unsupported hash algorithm")
+        return hashlib.new(algorithm)
+
+    @staticmethod
+    def _hexdigest(hasher) -> str:
+        # SHAKE algorithms need an explicit digest length
+        if hasher.name.startswith("shake_"):
+            return hasher.hexdigest(hasher.digest_size * 2 or 32)
+        return hasher.hexdigest()
+
     def hash_text(self, text: str, algorithm: str = "sha256") -> str:
         """Generate hash of text"""
-        if algorithm == "md5":
-            return hashlib.md5(text.encode()).hexdigest()
-        elif algorithm == "sha256":
-            return hashlib.sha256(text.encode()).hexdigest()
-        else:
-            raise ValueError("Unsupported hash algorithm")
+        hasher = self._new_hash(algorithm)
+        hasher.update(text.encode())
+        return self._hexdigest(hasher)
+
+    def hash_file(self, file_path: str, algorithm: str = "sha256", use_cache: bool = True,
+                  save: bool = True) -> str:
+        """Generate hash of a file, streaming its contents in fixed-size chunks"""
+        hasher = self._new_hash(algorithm)
+        stat = os.stat(file_path)
+        if use_cache:
+            cached = self.hash_cache.get(file_path, stat, algorithm)
+            if cached is not None:
+                return cached
+
+        with open(file_path, 'rb') as f:
+            if stat.st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, len(view), CHUNK_SIZE):
+                            hasher.update(view[offset:offset + CHUNK_SIZE])
+                    finally:
+                        view.release()
+            else:
+                buffer = bytearray(CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    hasher.update(view[:read])
+
+        digest = self._hexdigest(hasher)
+        if use_cache:
+            self.hash_cache.put(file_path, stat, algorithm, digest)
+            if save:
+                self.hash_cache.save()
+        return digest
+
+    def hash_directory(self, directory: str, algorithm: str = "sha256",
+                       max_workers: Optional[int] = None, use_cache: bool = True) -> Dict[str, str]:
+        """Hash every file below a directory in parallel, keyed by relative path"""
+        if not os.path.isdir(directory):
+            raise ValueError(f"Not a directory: {directory}")
+        self._new_hash(algorithm)  # Fail fast on unknown algorithms
+
+        file_paths = []
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                file_paths.append(os.path.join(root, name))
+
+        # hashlib releases the GIL on large updates, so threads scale here
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                    progress.task(f"Hashing {directory}", total=len(file_paths)) as task:
+                results = {}
+                digests = executor.map(lambda p: self.hash_file(p, algorithm, use_cache, save=False), file_paths)
+                for path, digest in zip(file_paths, digests):
+                    results[os.path.relpath(path, directory)] = digest
+                    task.advance()
+        finally:
+            # One write per directory, kept even if a file fails midway
+            if use_cache:
+                self.hash_cache.save()
+        self.logger.debug(f"Hashed {len(results)} files in {directory}")
+        return results
+
+    def fingerprint_directory(self, directory: str, algorithm: str = "sha256",
+                              max_workers: Optional[int] = None) -> str:
+        """Combine all file digests of a directory into a single fingerprint"""
+        hasher = self._new_hash(algorithm)
+        for rel_path, digest in sorted(self.hash_directory(directory, algorithm, max_workers).items()):
+            hasher.update(f"{rel_path}\0{digest}\n".encode())
+        return self._hexdigest(hasher)
     
     def get_timestamp(self) -> str:
         """Get current timestamp"""
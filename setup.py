@@ -22,6 +22,8 @@ setup(
        entry_points={
            'console_scripts': [
                'consolar=ConSolar.main:main',  # Adjust this to your main entry point
+               'consolar-dashboard=ConSolar.dashboard:main',
+               'consolar-logs=ConSolar.log_viewer:main',
            ],
        },
 )
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from cache_manager import CacheManager
+
+class _Opaque:
+    """Unhashable object whose repr says nothing about its state"""
+
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return "<Opaque>"
+
+class MemoizeKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = CacheManager(os.path.join(self.tmp.name, "memo.sqlite3"))
+        self.calls = []
+
+    def tearDown(self):
+        if self.manager._persistent is not None:
+            self.manager._persistent.close()
+        self.tmp.cleanup()
+
+    def _memoized(self, persistent: bool = False):
+        @self.manager.memoize(persistent=persistent, name="echo")
+        def echo(*args, **kwargs):
+            self.calls.append((args, kwargs))
+            return repr((args, kwargs))
+        return echo
+
+    def test_unhashable_arguments_with_equal_reprs_do_not_collide(self):
+        echo = self._memoized()
+        echo(_Opaque(1))
+        echo(_Opaque(2))
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(len(echo.cache), 0)  # Not cached at all
+
+    def test_container_types_are_kept_apart(self):
+        echo = self._memoized()
+        self.assertEqual(echo([1, 2], {"a": [1]}), echo([1, 2], {"a": [1]}))
+        echo([1, (2,)])
+        echo([1, [2]])
+        echo([{1: "x"}])
+        echo([{"1": "x"}])
+        self.assertEqual(len(self.calls), 5)
+
+    def test_dict_order_does_not_matter(self):
+        echo = self._memoized()
+        echo([{"a": 1, "b": 2}])
+        echo([{"b": 2, "a": 1}])
+        self.assertEqual(len(self.calls), 1)
+
+    def test_persistent_keys_are_canonical(self):
+        echo = self._memoized(persistent=True)
+        echo([1, 2], flag=True)
+        echo.cache.clear()  # Memory only; the persisted entry must still be found
+        echo([1, 2], flag=True)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(echo.cache.stats.disk_hits, 1)
+
+    def test_process_local_objects_are_not_persisted(self):
+        echo = self._memoized(persistent=True)
+        marker = object()
+        echo(marker)
+        echo.cache.clear()
+        echo(object())
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(echo.cache.stats.disk_hits, 0)
+
+if __name__ == "__main__":
+    unittest.main()
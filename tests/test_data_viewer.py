@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+import data_viewer
+from data_viewer import TableSource, pd
+
+CSV = "a,b\n1,x\n\n2,y\n   \n3,z\n \r\n4,w\n\t\n5,v"
+JSONL = '{"a": 1}\n\n{"a": 2}\n  \n{"a": 3}\n{"a": 4}\n'
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TableSourceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, text: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def _assert_pages_match(self, source: TableSource, expected: "pd.DataFrame") -> None:
+        self.assertEqual(source.row_count, len(expected))
+        for start in range(len(expected)):
+            for count in (1, 2, 3):
+                page = source.read_rows(start, count).reset_index(drop=True)
+                wanted = expected.iloc[start:start + count].reset_index(drop=True)
+                self.assertEqual(page.to_dict("records"), wanted.to_dict("records"), (start, count))
+
+    def test_blank_lines_are_skipped_like_read_csv(self):
+        path = self._write("data.csv", "\n" + CSV)
+        expected = pd.read_csv(path)
+        for block in (3, 7, 1024):  # Index points and lines straddling block boundaries
+            with mock.patch.object(data_viewer, "READ_BLOCK", block):
+                self._assert_pages_match(TableSource(path, index_every=2), expected)
+
+    def test_blank_lines_are_skipped_like_read_json(self):
+        path = self._write("data.jsonl", JSONL)
+        expected = pd.read_json(path, lines=True)
+        with mock.patch.object(data_viewer, "READ_BLOCK", 5):
+            self._assert_pages_match(TableSource(path, index_every=2), expected)
+
+    def test_aggregate_drops_min_max_of_mixed_columns(self):
+        path = self._write("mixed.csv", "a,b\n" + "".join(f"{i},{i}\n" for i in range(4)) + "x,4\ny,5\n")
+        result = TableSource(path, chunksize=4).aggregate(value_counts=["b"])
+        self.assertEqual(result["count"], 6)
+        self.assertNotIn("a", result["min"])
+        self.assertNotIn("a", result["max"])
+        self.assertEqual((result["min"]["b"], result["max"]["b"]), (0, 5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from dependency_resolver import DependencyResolver
+from snapshot import StartupSnapshot
+
+class DependencyResolverTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        snapshot = StartupSnapshot(os.path.join(self.tmp.name, "startup_snapshot.json"))
+        patcher = mock.patch("dependency_resolver.startup_snapshot", snapshot)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.resolver = DependencyResolver()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_newest_compatible_versions_are_selected(self):
+        resolution = self.resolver.resolve({
+            "App": {"1.0": ["Lib<2"], "2.0": ["Lib>=2,<3"]},
+            "Lib": {"1.5": [], "2.1": [], "3.0": []},
+            "Pinned": {"1.0": ["Lib~=2.0"]},
+        })
+        self.assertEqual(resolution.selected, {"App": "2.0", "Lib": "2.1", "Pinned": "1.0"})
+        self.assertEqual(resolution.order[0], "Lib")
+        self.assertEqual(resolution.conflicts, [])
+
+    def test_older_version_is_picked_when_newest_conflicts(self):
+        resolution = self.resolver.resolve({
+            "App": {"1.0": ["Lib==1.*"], "2.0": ["Lib>=2"]},
+            "Lib": {"1.2": [], "2.0": ["Base>=5"]},
+            "Base": {"4.0": []},
+        })
+        self.assertEqual(resolution.selected, {"App": "1.0", "Lib": "1.2", "Base": "4.0"})
+
+    def test_cycle_excludes_members_and_dependents(self):
+        resolution = self.resolver.resolve({
+            "A": {"1": ["B"]}, "B": {"1": ["A"]}, "C": {"1": ["A"]}, "D": {"1": []},
+        })
+        self.assertEqual(resolution.selected, {"D": "1"})
+        self.assertIn("A: circular dependency between A, B", resolution.conflicts)
+        self.assertIn("C: requires A which was excluded (A: circular dependency between A, B)",
+                      resolution.conflicts)
+
+    def test_conflict_only_excludes_its_own_group(self):
+        manifest = {f"P{i}": {"1.0": [], "2.0": [], "3.0": []} for i in range(10)}
+        manifest.update({
+            "ZA": {"1.0": ["ZB==1.0"]}, "ZB": {"1.0": ["ZC>=2"], "2.0": []}, "ZC": {"1.0": ["ZA"]},
+        })
+        start = time.perf_counter()
+        resolution = self.resolver.resolve(manifest)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(resolution.selected, {f"P{i}": "3.0" for i in range(10)})
+        self.assertEqual(sorted(c.split(":")[0] for c in resolution.conflicts), ["ZA", "ZB", "ZC"])
+
+    def test_excluded_dependency_is_not_reported_as_missing(self):
+        resolution = self.resolver.resolve({
+            "A": {"1": ["B"]}, "B": {"1": ["Missing"]},
+        })
+        self.assertEqual(resolution.conflicts, [
+            "B: v1 requires Missing which is not installed",
+            "A: v1 requires B which was excluded (B: v1 requires Missing which is not installed)",
+        ])
+
+    def test_invalid_declaration_only_excludes_that_plugin(self):
+        resolution = self.resolver.resolve({"Bad": {"1": [None]}, "Good": {"1": []}})
+        self.assertEqual(resolution.selected, {"Good": "1"})
+        self.assertTrue(resolution.conflicts[0].startswith("Bad: Invalid dependency specification"))
+
+    def test_long_dependency_chain(self):
+        manifest = {f"C{i}": {"1.0": [f"C{i - 1}"] if i else []} for i in range(3000)}
+        resolution = self.resolver.resolve(manifest)
+        self.assertEqual(resolution.order, [f"C{i}" for i in range(3000)])
+
+        manifest["C0"] = {"1.0": ["Missing"]}
+        resolution = DependencyResolver()._solve(manifest)
+        self.assertEqual(resolution.selected, {})
+        self.assertEqual(len(resolution.conflicts), 3000)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from event_bus import EventBus
+
+class EventBusTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+
+    def tearDown(self):
+        self.bus.shutdown()
+
+    def test_batches_are_delivered_and_joined(self):
+        received = []
+        subscription = self.bus.subscribe("t", received.extend, asynchronous=True, batch_size=10)
+        for i in range(100):
+            self.bus.publish("t", i)
+        subscription.join()
+        self.assertEqual([event.payload for event in received], list(range(100)))
+        self.assertEqual(self.bus.stats()["subscribers"][f"{subscription.name}@t"]["delivered"], 100)
+
+    def test_unsubscribe_stops_idle_worker(self):
+        subscription = self.bus.subscribe("t", lambda event: None, asynchronous=True)
+        self.bus.unsubscribe(subscription)
+        subscription._worker.join(timeout=1)
+        self.assertFalse(subscription._worker.is_alive())
+
+    def test_queued_events_are_not_delivered_after_unsubscribe(self):
+        started, release = threading.Event(), threading.Event()
+        received = []
+
+        def slow(event):
+            received.append(event.payload)
+            started.set()
+            release.wait(5)
+
+        subscription = self.bus.subscribe("t", slow, asynchronous=True)
+        self.bus.publish("t", 0)
+        started.wait(5)
+        for i in range(1, 6):
+            self.bus.publish("t", i)
+        self.bus.unsubscribe(subscription)
+        release.set()
+        subscription._worker.join(timeout=1)
+        self.assertFalse(subscription._worker.is_alive())
+        self.assertEqual(received, [0])
+        self.assertEqual(subscription.dropped, 5)
+
+    def test_subscriber_can_cancel_itself(self):
+        subscription = self.bus.subscribe("t", lambda event: subscription.cancel(), asynchronous=True, max_queue=1)
+        self.bus.publish("t")
+        subscription._worker.join(timeout=1)
+        self.assertFalse(subscription._worker.is_alive())
+        self.assertEqual(self.bus.subscribers("t"), [])
+
+    def test_concurrent_publish_counts(self):
+        def publish():
+            for _ in range(5000):
+                self.bus.publish("t")
+
+        threads = [threading.Thread(target=publish) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.bus.stats()["published"]["t"], 40000)
+
+if __name__ == "__main__":
+    unittest.main()
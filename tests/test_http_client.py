@@ -0,0 +1,136 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from config_manager import ConfigManager
+from http_client import HttpClient, ResponseCache
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves a fixed body with an ETag and echoes the Authorization header back"""
+
+    # Paths answered with a Cache-Control header
+    CACHE_CONTROL = {"/no-store": "no-store", "/no-cache": "no-cache",
+                     "/max-age-0": "max-age=0", "/max-age-3600": "public, max-age=3600"}
+    requests_served = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            type(self).requests_served += 1
+        auth = self.headers.get("Authorization", "anonymous")
+        etag = f'"{auth}"'
+        cache_control = self.CACHE_CONTROL.get(self.path)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = f"{self.path} for {auth}".encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class HttpClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        config = ConfigManager(config_dir=os.path.join(self.tmp.name, "config"))
+        config.config_data = {"http": {"cache_dir": os.path.join(self.tmp.name, "http"), "cache_ttl": 300}}
+        self.client = HttpClient(config)
+        _StandInHandler.requests_served = 0
+
+    def tearDown(self):
+        self.client.close()
+        self.tmp.cleanup()
+
+    def test_fresh_response_is_served_from_cache(self):
+        first = self.client.get(self.base + "/a")
+        second = self.client.get(self.base + "/a")
+        self.assertEqual(first.text, second.text)
+        self.assertTrue(getattr(second, "from_cache", False))
+        self.assertEqual(_StandInHandler.requests_served, 1)
+
+    def test_stale_response_is_revalidated(self):
+        self.client.cache.ttl = 0
+        self.client.get(self.base + "/b")
+        response = self.client.get(self.base + "/b")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "/b for anonymous")
+        self.assertEqual(self.client.stats()["revalidated"], 1)
+
+    def test_cache_is_keyed_on_authorization(self):
+        alice = self.client.get(self.base + "/c", headers={"Authorization": "alice"})
+        bob = self.client.get(self.base + "/c", headers={"Authorization": "bob"})
+        self.assertEqual(alice.text, "/c for alice")
+        self.assertEqual(bob.text, "/c for bob")
+        self.assertEqual(_StandInHandler.requests_served, 2)
+
+    def test_concurrent_fetches_of_one_url(self):
+        self.client.cache.ttl = 0  # Every fetch rewrites the same cache entry
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            for response in executor.map(lambda _: self.client.get(self.base + "/d"), range(100)):
+                self.assertEqual(response.text, "/d for anonymous")
+        self.assertFalse([name for name in os.listdir(self.client.cache.cache_dir) if name.endswith(".tmp")])
+
+    def test_fetch_many_fetches_duplicates_once(self):
+        urls = [self.base + "/e", self.base + "/f", self.base + "/e"]
+        results = self.client.fetch_many(urls, use_cache=False)
+        self.assertEqual(list(results), [self.base + "/e", self.base + "/f"])
+        self.assertEqual(results[self.base + "/e"].text, "/e for anonymous")
+        self.assertEqual(_StandInHandler.requests_served, 2)
+
+    def test_no_store_response_is_not_cached(self):
+        self.client.get(self.base + "/no-store")
+        self.client.get(self.base + "/no-store")
+        self.assertEqual(_StandInHandler.requests_served, 2)
+        self.assertEqual(os.listdir(self.client.cache.cache_dir), [])
+
+    def test_no_cache_response_is_always_revalidated(self):
+        self.client.get(self.base + "/no-cache")
+        response = self.client.get(self.base + "/no-cache")
+        self.assertEqual(response.text, "/no-cache for anonymous")
+        self.assertEqual(self.client.stats()["revalidated"], 1)
+
+    def test_max_age_overrides_ttl(self):
+        self.client.get(self.base + "/max-age-0")
+        self.client.get(self.base + "/max-age-0")
+        self.assertEqual(self.client.stats()["revalidated"], 1)
+
+        self.client.cache.ttl = 0
+        self.client.get(self.base + "/max-age-3600")
+        response = self.client.get(self.base + "/max-age-3600")
+        self.assertTrue(getattr(response, "from_cache", False))
+        self.assertEqual(_StandInHandler.requests_served, 3)
+
+    def test_request_no_cache_skips_fresh_copy(self):
+        self.client.get(self.base + "/g")
+        self.client.get(self.base + "/g", headers={"Cache-Control": "no-cache"})
+        self.assertEqual(self.client.stats()["revalidated"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import itertools
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from cache_manager import cache_manager
+from plugin_manger import PluginManager
+from scheduler import scheduler
+
+_package_ids = itertools.count()
+
+GOOD_PLUGIN = '''
+from plugin_manger import EnhancedPlugin
+from cache_manager import cached_method
+
+VERSION = {version}
+
+class Ticker(EnhancedPlugin):
+    def on_register(self, framework):
+        self.schedule_every(3600, lambda: None)
+
+    @cached_method()
+    def value(self):
+        return VERSION
+'''
+
+BROKEN_PLUGIN = GOOD_PLUGIN + '''
+class Broken(EnhancedPlugin):
+    def on_register(self, framework):
+        raise RuntimeError("broken on purpose")
+'''
+
+class PluginReloadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        sys.path.insert(0, self.tmp.name)
+        # A fresh package name per test keeps sys.modules entries apart
+        self.package = f"reload_plugins_{next(_package_ids)}"
+        os.makedirs(self.package)
+        open(os.path.join(self.package, "__init__.py"), "w").close()
+        self.module = f"{self.package}.ticker"
+        self._write(GOOD_PLUGIN.format(version=1))
+        self.manager = PluginManager(self.package)
+        self.manager.load_all_plugins(use_snapshot=False)
+
+    def tearDown(self):
+        self.manager.unload_all_plugins()
+        sys.path.remove(self.tmp.name)
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _write(self, source: str) -> None:
+        path = os.path.join(self.package, "ticker.py")
+        with open(path, "w") as f:
+            f.write(source)
+        # Make sure the change is visible even on coarse mtime filesystems
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _jobs(self) -> int:
+        return sum(1 for job in scheduler.list_jobs() if job["owner"] == "Ticker")
+
+    def test_load_does_not_hash_sources(self):
+        self.assertEqual(self.manager.list_plugins(), ["Ticker"])
+        self.assertIsNone(self.manager.module_sources[self.module][2])
+        self.assertEqual(self.manager.check_for_changes(), [])
+        self.assertIsNotNone(self.manager.module_sources[self.module][2])
+
+    def test_failed_reload_releases_staged_plugins(self):
+        self.assertEqual(self._jobs(), 1)
+        self._write(BROKEN_PLUGIN.format(version=2))
+        for _ in range(3):  # What watch() would do on consecutive polls
+            self.manager.reload_changed()
+        self.assertEqual(self._jobs(), 1)
+        self.assertEqual(self.manager.list_plugins(), ["Ticker"])
+        self.assertEqual(self.manager.check_for_changes(), [])
+
+    def test_reload_clears_cached_results(self):
+        plugin = self.manager.get_plugin_by_name("Ticker")
+        self.assertEqual(plugin.value(), 1)
+        self._write(GOOD_PLUGIN.format(version=2))
+        self.assertEqual(self.manager.reload_changed(), [self.module])
+        reloaded = self.manager.get_plugin_by_name("Ticker")
+        self.assertIsNot(reloaded, plugin)
+        self.assertEqual(reloaded.value(), 2)
+        self.assertEqual(self._jobs(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
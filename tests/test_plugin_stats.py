@@ -0,0 +1,64 @@
+import functools
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from plugin_stats import CallStats, PluginAccounting
+
+class _Sample:
+    def __init__(self):
+        self.property_reads = 0
+
+    def work(self, value):
+        return value * 2
+
+    @staticmethod
+    def helper():
+        return "helper"
+
+    @property
+    def expensive(self):
+        self.property_reads += 1
+        raise RuntimeError("property getters must not run during instrument()")
+
+    @functools.cached_property
+    def computed(self):
+        self.property_reads += 1
+        return 1
+
+class PluginAccountingTest(unittest.TestCase):
+    def setUp(self):
+        self.accounting = PluginAccounting()
+        self.accounting.enable()
+
+    def test_instrument_wraps_methods_without_reading_properties(self):
+        plugin = _Sample()
+        self.accounting.instrument(plugin)
+        self.assertEqual(plugin.property_reads, 0)
+        self.assertEqual(plugin.work(2), 4)
+        self.assertEqual(plugin.helper(), "helper")
+        methods = self.accounting.usage["_Sample"].methods
+        self.assertEqual(sorted(methods), ["helper", "work"])
+        self.assertEqual(methods["work"].calls, 1)
+        self.assertEqual(plugin.computed, 1)
+
+    def test_concurrent_adds_are_all_counted(self):
+        stats = CallStats()
+
+        def add():
+            for _ in range(20000):
+                stats.add(0.001, 0.001)
+
+        threads = [threading.Thread(target=add) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(stats.calls, 160000)
+        self.assertAlmostEqual(stats.wall, 160.0, places=6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from scheduler import CronSchedule, Scheduler
+
+class CronScheduleTest(unittest.TestCase):
+    def test_fields(self):
+        schedule = CronSchedule("*/15 9-17 1,15 * 1-5")
+        self.assertEqual(schedule.minutes, {0, 15, 30, 45})
+        self.assertEqual(schedule.hours, set(range(9, 18)))
+        self.assertEqual(schedule.days, {1, 15})
+        self.assertEqual(schedule.weekdays, {1, 2, 3, 4, 5})
+
+    def test_seven_is_sunday(self):
+        self.assertEqual(CronSchedule("0 0 * * 7").weekdays, {0})
+        self.assertEqual(CronSchedule("0 0 * * 5-7").weekdays, {5, 6, 0})
+
+    def test_invalid_expressions_raise_value_error(self):
+        for expression in ("0 0 * * 8", "0 0 * * 5-9", "60 * * * *", "* 24 * * *", "* * 0 * *",
+                           "* * * 13 *", "*/0 * * * *", "x * * * *", "5-1 * * * *", "* * * *"):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    CronSchedule(expression)
+
+    def test_next_after(self):
+        monday = datetime(2026, 10, 19, 10, 0)
+        self.assertEqual(CronSchedule("30 9 * * 1").next_after(monday), datetime(2026, 10, 26, 9, 30))
+        self.assertEqual(CronSchedule("*/5 * * * *").next_after(monday), datetime(2026, 10, 19, 10, 5))
+        # With both day fields restricted either one matches, as in classic cron
+        self.assertEqual(CronSchedule("0 0 13 * 5").next_after(monday), datetime(2026, 10, 23, 0, 0))
+
+class SchedulerClockTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler(max_workers=1)
+        self.real_time = time.time
+
+    def tearDown(self):
+        self.scheduler.shutdown(wait=False)
+
+    def _move_wall_clock(self, seconds: float):
+        return mock.patch("time.time", side_effect=lambda: self.real_time() + seconds)
+
+    def test_delays_ignore_wall_clock_changes(self):
+        fired = threading.Event()
+        self.scheduler.after(0.5, fired.set)
+        with self._move_wall_clock(3600):
+            self.assertFalse(fired.wait(0.2))
+            self.assertTrue(fired.wait(2))
+
+    def test_cron_follows_wall_clock_changes(self):
+        fired = threading.Event()
+        job = self.scheduler.cron("* * * * *", fired.set)
+        seconds_to_go = job.next_run - self.real_time()
+        with self._move_wall_clock(seconds_to_go + 1):
+            with self.scheduler._condition:
+                self.scheduler._condition.notify()
+            self.assertTrue(fired.wait(2))
+
+if __name__ == "__main__":
+    unittest.main()
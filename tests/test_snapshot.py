@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ConSolar"))
+
+from snapshot import StartupSnapshot
+
+class StartupSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "startup_snapshot.json")
+        self.snapshot = StartupSnapshot(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _reopen(self) -> StartupSnapshot:
+        """A new instance reading the file, as the next process start would"""
+        return StartupSnapshot(self.path)
+
+    def test_unchanged_save_does_not_rewrite(self):
+        self.snapshot.save("plugins", "abc", {"order": ["a", "b"]})
+        snapshot = self._reopen()
+        with mock.patch.object(snapshot, "_write") as write:
+            self.assertEqual(snapshot.load("plugins", "abc"), {"order": ["a", "b"]})
+            snapshot.record_timing("plugins", "warm", 0.01)
+            snapshot.save("plugins", "abc", {"order": ["a", "b"]})
+        write.assert_not_called()
+
+    def test_changed_fingerprint_is_written(self):
+        self.snapshot.save("plugins", "abc", {"order": ["a"]})
+        self.snapshot.record_timing("plugins", "cold", 0.5)
+        self.snapshot.save("plugins", "def", {"order": ["a"]})
+        snapshot = self._reopen()
+        self.assertIsNone(snapshot.load("plugins", "abc"))
+        self.assertEqual(snapshot.load("plugins", "def"), {"order": ["a"]})
+        self.assertEqual(snapshot.get_timings()["plugins"]["cold"]["seconds"], 0.5)
+
+    def test_fingerprint_tracks_file_edits(self):
+        plugin_dir = os.path.join(self.tmp.name, "plugins")
+        os.makedirs(plugin_dir)
+        module = os.path.join(plugin_dir, "a.py")
+        with open(module, "w") as f:
+            f.write("x = 1\n")
+        before = StartupSnapshot.fingerprint([plugin_dir])
+        self.assertEqual(before, StartupSnapshot.fingerprint([plugin_dir]))
+        with open(module, "w") as f:
+            f.write("x = 22\n")
+        self.assertNotEqual(before, StartupSnapshot.fingerprint([plugin_dir]))
+
+if __name__ == "__main__":
+    unittest.main()
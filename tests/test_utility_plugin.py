@@ -0,0 +1,74 @@
+import importlib
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "ConSolar"))
+sys.path.insert(0, ROOT)
+
+def _import_utility_plugin():
+    # ConSolar/__init__ runs the interactive core demo on import, so expose the
+    # package's submodules without executing it
+    if "ConSolar" not in sys.modules:
+        package = types.ModuleType("ConSolar")
+        package.__path__ = [os.path.join(ROOT, "ConSolar")]
+        sys.modules["ConSolar"] = package
+    return importlib.import_module("plugins.utility_plugin")
+
+utility_plugin = _import_utility_plugin()
+
+class HashCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "hash_cache.json")
+        self.plugin = utility_plugin.UtilityPlugin()
+        self.plugin.hash_cache = utility_plugin.HashCache(self.cache_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp.name, "files", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _saved_entries(self) -> dict:
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_hash_file_is_persisted_immediately(self):
+        path = self._write("a.txt", b"hello")
+        digest = self.plugin.hash_file(path)
+        self.assertIn(digest, [entry[2] for entry in self._saved_entries().values()])
+
+    def test_hash_directory_saves_once_finished(self):
+        self._write("a.txt", b"a")
+        self._write("b.txt", b"b")
+        results = self.plugin.hash_directory(os.path.join(self.tmp.name, "files"))
+        self.assertEqual(sorted(results), ["a.txt", "b.txt"])
+        self.assertEqual(len(self._saved_entries()), 2)
+
+    def test_missing_files_are_pruned_on_save(self):
+        kept = self._write("kept.txt", b"1")
+        gone = self._write("gone.txt", b"2")
+        self.plugin.hash_file(kept)
+        self.plugin.hash_file(gone)
+        os.remove(gone)
+        self.plugin.hash_file(self._write("new.txt", b"3"))
+        paths = [key.split(":", 1)[1] for key in self._saved_entries()]
+        self.assertIn(os.path.abspath(kept), paths)
+        self.assertNotIn(os.path.abspath(gone), paths)
+
+    def test_cached_digest_matches_fresh_digest(self):
+        path = self._write("c.txt", b"x" * 10000)
+        cached = self.plugin.hash_file(path)
+        self.assertEqual(cached, self.plugin.hash_file(path, use_cache=False))
+
+if __name__ == "__main__":
+    unittest.main()